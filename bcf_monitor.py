@@ -1,9 +1,15 @@
 import argparse
+import calendar
+import hashlib
 import json
 import os
 import re
 import sys
 import smtplib
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -11,14 +17,35 @@ from urllib.parse import urljoin
 
 import requests
 import certifi
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
 
 BASE_URL = "https://boylstonchess.org"
 EVENTS_URL = "https://boylstonchess.org/events"
+ENTRIES_PATH = "/tournament/entries/"
 USER_AGENT = "bcf-monitor/0.1 (+https://boylstonchess.org/events)"
 HTTP_TIMEOUT_SECONDS = 20
+FETCH_WORKERS = 8
+SNAPSHOT_PEEK_BYTES = 4096
+
+# On-disk HTTP cache (under the data directory) for pages that rarely change;
+# entry lists are always fetched fresh
+HTTP_CACHE_DIRNAME = ".cache"
+EVENTS_PAGE_CACHE_TTL_SECONDS = 300
+DETAIL_PAGE_CACHE_TTL_SECONDS = 3600
+# Cached pages not fetched or revalidated for this long are pruned during cleanup
+HTTP_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
 
 # Email configuration - can be overridden by environment variables
 EMAIL_SMTP_SERVER = os.getenv("BCF_EMAIL_SMTP_SERVER", "smtp.gmail.com")
@@ -31,12 +58,88 @@ EMAIL_TO = os.getenv("BCF_EMAIL_TO", "")
 # Configuration file path
 DEFAULT_CONFIG_FILE = "bcf_monitor_config.json"
 
+# Precompiled regular expressions used by the parsers
+_WS_RE = re.compile(r"\s+")
+_NUMERIC_DATE_RE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+_MONTH_YEAR_RE = re.compile(r"([A-Za-z]+).*?(\d{4})")
+_WEEKDAY_PREFIX_RE = re.compile(r"^[A-Za-z]+,\s*")
+_DAY_NUMBER_RE = re.compile(r"\b(\d{1,2})\b")
+_DIGITS_RE = re.compile(r"^\d+$")
+_DATE_LABEL_RE = re.compile(r"^date$", re.I)
+_DATE_LABEL_STR_RE = re.compile(r"^\s*Date\s*$", re.I)
+_DETAIL_HREF_RE = re.compile(r"^/events/\d+")
+# Any link that carries an event id (detail, registration or entry-list page);
+# also used to filter anchors during the search
+_EVENT_ID_RE = re.compile(r"/(?:events|tournament/register|tournament/entries)/(\d+)")
+_REGISTRATION_TITLE_RE = re.compile(r"Registration List[^•]*•\s*([^•]+)\s*•")
+_ENTRY_LIST_STRAINER = SoupStrainer(["title", "table"])
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+# Nothing in <head> is used on the events page (headings, blocks and dates are all in <body>)
+_EVENTS_PAGE_STRAINER = SoupStrainer("body")
+# Everything parse_event_details reads; dt/dd pairs stay intact inside their <dl>
+_EVENT_DETAILS_STRAINER = SoupStrainer(["title", "h1", "table", "dl"])
+
+# Entry-list table heuristics
+_ENTRY_HEADER_KEYWORDS = ("name", "player", "entrant", "entry", "participant")
+_NON_NAME_CELLS = frozenset({"name", "player", "entrant", "entry", "#", "no", "yes"})
+_NAV_WORDS = ("home", "about", "contact", "login", "register", "search", "menu", "navigation")
+_SNAPSHOT_DATES_RE = re.compile(rb'"event_dates"\s*:\s*(\[[^\]]*\])')
+
+
+# TLS contexts are built once. Given only a CA bundle path, urllib3 reloads the
+# bundle (or the OS defaults, when unverified) for every new connection.
+_CA_BUNDLE = certifi.where()
+_SSL_CONTEXT = create_urllib3_context()
+_SSL_CONTEXT.load_verify_locations(_CA_BUNDLE)
+_SSL_CONTEXT_INSECURE = create_urllib3_context(cert_reqs=ssl.CERT_NONE)
+
+
+class _SharedSSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter that hands urllib3 the prebuilt SSL contexts above.
+
+    Relies on build_connection_pool_key_attributes, which requests added in
+    2.32 (hence the pin in requirements.txt).
+    """
+
+    @staticmethod
+    def _context_for(verify):
+        if verify is False:
+            return _SSL_CONTEXT_INSECURE
+        if verify == _CA_BUNDLE:
+            return _SSL_CONTEXT
+        return None
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        context = self._context_for(verify)
+        if context is not None and host_params["scheme"] == "https":
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs["ssl_context"] = context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self._context_for(verify) is not None:
+            # The pool's ssl_context already holds the CA bundle
+            conn.ca_certs = None
+
+
+# Shared HTTP session so every fetch to the BCF site reuses a keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = USER_AGENT
+_ADAPTER = _SharedSSLContextAdapter(
+    pool_connections=2,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
 
 def http_get(url: str, insecure: bool = False) -> str:
-    verify_val = False if insecure else certifi.where()
-    response = requests.get(
+    verify_val = False if insecure else _CA_BUNDLE
+    response = _SESSION.get(
         url,
-        headers={"User-Agent": USER_AGENT},
         timeout=HTTP_TIMEOUT_SECONDS,
         verify=verify_val,
     )
@@ -44,20 +147,171 @@ def http_get(url: str, insecure: bool = False) -> str:
     return response.text
 
 
+def http_get_cached(url: str, cache_dir: str, ttl_seconds: int, insecure: bool = False) -> str:
+    """GET a page through the on-disk cache in ``cache_dir``.
+
+    A copy younger than ``ttl_seconds`` is returned without touching the network.
+    An older copy is revalidated with the ETag/Last-Modified the server sent, so an
+    unchanged page costs a 304 instead of a full download.
+    """
+    base = os.path.join(cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest())
+    body_path, meta_path = base + ".html", base + ".meta.json"
+    try:
+        age = time.time() - os.path.getmtime(body_path)
+        with open(body_path, "r", encoding="utf-8") as f:
+            cached = f.read()
+    except OSError:
+        age, cached = None, None
+    if cached is not None and age < ttl_seconds:
+        return cached
+
+    headers = {}
+    if cached is not None:
+        try:
+            with open(meta_path, "rb") as f:
+                meta = json_loads(f.read())
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        except (OSError, ValueError):
+            pass
+
+    response = _SESSION.get(
+        url,
+        headers=headers,
+        timeout=HTTP_TIMEOUT_SECONDS,
+        verify=False if insecure else _CA_BUNDLE,
+    )
+    if response.status_code == 304 and cached is not None:
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return cached
+    response.raise_for_status()
+    text = response.text
+
+    # A failed cache write only costs a refetch next time
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = body_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, body_path)
+        with open(meta_path, "wb") as f:
+            f.write(json_dumps({
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }))
+    except OSError:
+        pass
+    return text
+
+
+def prune_http_cache(cache_dir: str, max_age_seconds: int = HTTP_CACHE_MAX_AGE_SECONDS):
+    """Delete cache entries whose page has not been fetched or revalidated within ``max_age_seconds``.
+
+    A 304 touches the cached body, so the body's mtime decides for the whole
+    entry; its .meta.json (and any stray .tmp) goes with it.
+    """
+    cutoff = time.time() - max_age_seconds
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.name, e.path, e.stat().st_mtime) for e in it if e.is_file()]
+    except OSError:
+        return
+    live = {name[:-len(".html")] for name, _, mtime in entries
+            if name.endswith(".html") and mtime >= cutoff}
+    for name, path, mtime in entries:
+        if mtime < cutoff and name.split(".", 1)[0] not in live:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def fetch_all(urls: list, insecure: bool = False, cache_dir: str = None, ttls: list = None) -> list:
+    """Fetch several URLs concurrently, returning bodies (or the raised exception) in order.
+
+    Empty entries in ``urls`` are skipped and yield None. With ``cache_dir``, a URL whose
+    entry in ``ttls`` is set goes through http_get_cached with that TTL.
+    """
+    def fetch_one(url, ttl):
+        if not url:
+            return None
+        try:
+            if cache_dir and ttl:
+                return http_get_cached(url, cache_dir, ttl, insecure=insecure)
+            return http_get(url, insecure=insecure)
+        except Exception as ex:
+            return ex
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        return list(pool.map(fetch_one, urls, ttls or [None] * len(urls)))
+
+
+DATE_PATTERNS = [
+    "%A, %B %d, %Y",
+    "%B %d, %Y",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+]
+
+# The DATE_PATTERNS shapes, matched directly so well-formed dates skip strptime
+_NAMED_DATE_RE = re.compile(r"(?:([A-Za-z]+), )?([A-Za-z]+) (\d{1,2}), (\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_US_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTH_NUMBERS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
+_WEEKDAY_NAMES = frozenset(name.lower() for name in calendar.day_name)
+
+
+def _match_date_shape(cleaned: str):
+    """Build a date from a string shaped like one of DATE_PATTERNS, or return None."""
+    m = _NAMED_DATE_RE.fullmatch(cleaned)
+    if m:
+        weekday, month, day, year = m.groups()
+        if weekday is not None and weekday.lower() not in _WEEKDAY_NAMES:
+            return None
+        month_num = _MONTH_NUMBERS.get(month.lower())
+        if month_num is None:
+            return None
+        ymd = (int(year), month_num, int(day))
+    else:
+        m = _ISO_DATE_RE.fullmatch(cleaned)
+        if m:
+            ymd = tuple(map(int, m.groups()))
+        else:
+            m = _US_DATE_RE.fullmatch(cleaned)
+            if not m:
+                return None
+            mo, d, y = map(int, m.groups())
+            ymd = (y, mo, d)
+    try:
+        return datetime(*ymd).date()
+    except ValueError:
+        return None
+
+
 def parse_date(text: str):
-    cleaned = re.sub(r"\s+", " ", (text or "").strip())
-    patterns = [
-        "%A, %B %d, %Y",
-        "%B %d, %Y",
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-    ]
-    for fmt in patterns:
+    return _parse_cleaned_date(_WS_RE.sub(" ", (text or "").strip()))
+
+
+@lru_cache(maxsize=4096)
+def _parse_cleaned_date(cleaned: str):
+    # The same strings recur across blocks and parse_multiple_dates calls, so
+    # results are memoized
+    parsed = _match_date_shape(cleaned)
+    if parsed:
+        return parsed
+    # strptime still decides anything the shape patterns did not accept
+    for fmt in DATE_PATTERNS:
         try:
             return datetime.strptime(cleaned, fmt).date()
         except ValueError:
-            pass
-    m = re.search(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})", cleaned)
+            continue
+    m = _NUMERIC_DATE_RE.search(cleaned)
     if m:
         y, mo, d = map(int, m.groups())
         return datetime(y, mo, d).date()
@@ -70,12 +324,12 @@ def parse_multiple_dates(text: str):
         return []
     
     # Clean up the text
-    cleaned = re.sub(r"\s+", " ", text.strip())
+    cleaned = _WS_RE.sub(" ", text.strip())
     dates = []
     
     # Extract month and year information first
     # Look for month followed by year, but allow other text in between
-    month_year_match = re.search(r"([A-Za-z]+).*?(\d{4})", cleaned)
+    month_year_match = _MONTH_YEAR_RE.search(cleaned)
     if not month_year_match:
         # Fallback to single date parsing
         single_date = parse_date(cleaned)
@@ -86,9 +340,8 @@ def parse_multiple_dates(text: str):
     month_name = month_year_match.group(1)
     year = int(month_year_match.group(2))
     
-    try:
-        month_num = datetime.strptime(month_name, "%B").month
-    except ValueError:
+    month_num = _MONTH_NUMBERS.get(month_name.lower())
+    if month_num is None:
         # Fallback to single date parsing
         single_date = parse_date(cleaned)
         if single_date:
@@ -104,8 +357,8 @@ def parse_multiple_dates(text: str):
             end_text = parts[1].strip()
             
             # Remove day of week from start and end
-            start_clean = re.sub(r"^[A-Za-z]+,\s*", "", start_text)
-            end_clean = re.sub(r"^[A-Za-z]+,\s*", "", end_text)
+            start_clean = _WEEKDAY_PREFIX_RE.sub("", start_text)
+            end_clean = _WEEKDAY_PREFIX_RE.sub("", end_text)
             
             # Add year to both dates if not present
             if str(year) not in start_clean:
@@ -123,46 +376,13 @@ def parse_multiple_dates(text: str):
                     current += timedelta(days=1)
                 return dates
     
-    # Handle individual days (contains 'and' keyword)
-    elif 'and' in cleaned:
-        # Extract all day numbers from the text
-        day_numbers = []
-        
-        # Split by comma and 'and' to get individual day numbers
-        parts = re.split(r',\s*and\s*|,\s*', cleaned)
-        for part in parts:
-            # Extract day numbers from each part
-            numbers = re.findall(r'\b(\d{1,2})\b', part)
-            for num_str in numbers:
-                day = int(num_str)
-                if 1 <= day <= 31 and day != year:  # Exclude year
-                    day_numbers.append(day)
-        
-        # Create dates from day numbers
-        for day in day_numbers:
-            dates.append(datetime(year, month_num, day).date())
-        
-        if dates:
-            return sorted(dates)
-    
-    # Handle comma-separated days without 'and' keyword
-    elif ',' in cleaned:
-        # Extract all day numbers from the text
-        day_numbers = []
-        
-        # Split by comma to get individual day numbers
-        parts = cleaned.split(',')
-        for part in parts:
-            # Extract day numbers from each part
-            numbers = re.findall(r'\b(\d{1,2})\b', part)
-            for num_str in numbers:
-                day = int(num_str)
-                if 1 <= day <= 31 and day != year:  # Exclude year
-                    day_numbers.append(day)
-        
-        # Create dates from day numbers
-        for day in day_numbers:
-            dates.append(datetime(year, month_num, day).date())
+    # Handle individual days, separated by commas and/or 'and'
+    elif 'and' in cleaned or ',' in cleaned:
+        # Every standalone 1-2 digit number is a day (the year has four digits)
+        for num_str in _DAY_NUMBER_RE.findall(cleaned):
+            day = int(num_str)
+            if 1 <= day <= 31 and day != year:  # Exclude year
+                dates.append(datetime(year, month_num, day).date())
         
         if dates:
             return sorted(dates)
@@ -175,13 +395,64 @@ def parse_multiple_dates(text: str):
     return []
 
 
-def nearest_heading_text(elem) -> Optional[str]:
-    # First, try to find a more specific heading that's not generic
-    for heading in elem.find_all_previous(["h1", "h2", "h3", "h4", "h5"]):
-        heading_text = " ".join(heading.get_text(" ").split())
-        # Skip generic headings
-        if heading_text.lower() not in ["upcoming events", "events", "tournaments", "chess events"]:
-            return heading_text
+_HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5"])
+_GENERIC_HEADINGS = frozenset(["upcoming events", "events", "tournaments", "chess events"])
+# Texts in an event's container that are never its name
+_NON_EVENT_NAME_TEXTS = _GENERIC_HEADINGS | {"register online now", "date", "time", "location"}
+# Tags that delimit the block searched for an event's dates
+_DATE_BLOCK_TAGS = frozenset(["table", "div", "section", "article"])
+
+
+def index_preceding_headings(soup, blocks) -> dict:
+    """Record the headings that precede each block in a single forward pass.
+
+    Returns ``{id(block): (specific_heading_text, last_heading, last_strong)}``,
+    the same context ``nearest_heading_text`` would otherwise find by walking
+    the document backwards from every block.
+    """
+    wanted = {id(b) for b in blocks}
+    index = {}
+    specific_heading = heading = strong = None
+    for tag in soup.find_all(True):
+        if id(tag) in wanted:
+            index[id(tag)] = (specific_heading, heading, strong)
+        if tag.name in _HEADING_TAGS:
+            heading = tag
+            heading_text = " ".join(tag.get_text(" ").split())
+            if heading_text.lower() not in _GENERIC_HEADINGS:
+                specific_heading = heading_text
+        elif tag.name == "strong":
+            strong = tag
+    return index
+
+
+def _walk_preceding_headings(elem):
+    heading = None
+    # Walk previous_elements lazily; find_all_previous() would collect every
+    # earlier heading in the document before the first one is checked
+    for h in elem.previous_elements:
+        if h.name not in _HEADING_TAGS:
+            continue
+        heading = heading or h
+        heading_text = " ".join(h.get_text(" ").split())
+        if heading_text.lower() not in _GENERIC_HEADINGS:
+            return heading_text, heading, None
+    return None, heading, elem.find_previous(["strong"])
+
+
+def nearest_heading_text(elem, preceding: Optional[tuple] = None) -> Optional[str]:
+    """Find a meaningful event name for ``elem``.
+
+    ``preceding`` is the tuple recorded by ``index_preceding_headings``; when
+    omitted the document is walked backwards from ``elem`` instead.
+    """
+    if preceding is None:
+        preceding = _walk_preceding_headings(elem)
+    specific_heading, heading, strong = preceding
+
+    # First, prefer the nearest heading that's not generic
+    if specific_heading:
+        return specific_heading
     
     # If no specific heading found, try to find the event name in the link text or nearby text
     # Look for text that might be the event name in the same container
@@ -191,62 +462,109 @@ def nearest_heading_text(elem) -> Optional[str]:
         for text_elem in parent.find_all(["span", "div", "p", "strong", "b"]):
             text = " ".join(text_elem.get_text(" ").split())
             if (text and len(text) > 5 and 
-                text.lower() not in ["register online now", "upcoming events", "events", "tournaments", "chess events", "date", "time", "location"] and
+                text.lower() not in _NON_EVENT_NAME_TEXTS and
                 not text.startswith("http") and
-                not re.match(r"^\d+$", text)):
+                not _DIGITS_RE.match(text)):
                 return text
     
-    # Fallback to original logic
-    heading = elem.find_previous(["h1", "h2", "h3", "h4", "h5"])
+    # Fallback to the nearest heading or <strong> of any kind
     if heading:
         return " ".join(heading.get_text(" ").split())
-    strong = elem.find_previous(["strong"])
     if strong:
         return " ".join(strong.get_text(" ").split())
     return None
 
 
-def find_event_dates(elem):
-    """Find event dates, handling both single dates and multiple dates/ranges."""
-    block = elem.find_parent(["table", "div", "section", "article"]) or elem.parent
+def _enclosing_date_block(elem):
+    # Plain walk up .parents; cheaper than find_parent() building a matcher per call
+    for parent in elem.parents:
+        if parent.name in _DATE_BLOCK_TAGS:
+            return parent
+    return elem.parent
+
+
+def find_event_dates(elem, cache: Optional[dict] = None):
+    """Find event dates, handling both single dates and multiple dates/ranges.
+
+    When a ``cache`` dict is supplied, results are memoized per enclosing block
+    so anchors that share a block only walk it once.
+    """
+    block = _enclosing_date_block(elem)
     if not block:
         return []
-    
+    if cache is None:
+        return _find_block_dates(block)
+    key = id(block)
+    if key not in cache:
+        cache[key] = _find_block_dates(block)
+    return cache[key]
+
+
+def _find_block_dates(block):
     # Look in table rows first
     for tr in block.find_all("tr"):
         cells = [td.get_text(" ").strip() for td in tr.find_all(["td", "th"])]
         if not cells:
             continue
-        if re.search(r"^date$", cells[0], re.I) and len(cells) > 1:
+        if _DATE_LABEL_RE.search(cells[0]) and len(cells) > 1:
             dates = parse_multiple_dates(cells[1])
             if dates:
                 return dates
     
-    # Look for date labels
-    labels = block.find_all(string=re.compile(r"^\s*Date\s*$", re.I))
-    for lab in labels:
+    # Look for date labels; a plain walk over the strings is much cheaper than
+    # find_all(string=...) matching every descendant through a SoupStrainer
+    for lab in block.descendants:
+        if not isinstance(lab, NavigableString) or not _DATE_LABEL_STR_RE.match(lab):
+            continue
         sib = lab.parent.find_next(string=True)
         if sib:
             dates = parse_multiple_dates(sib)
             if dates:
                 return dates
     
-    # Look for date patterns in the text
-    txt = " ".join(block.get_text(" ").split())
-    dates = parse_multiple_dates(txt)
+    # Look for date patterns in the text (parse_multiple_dates collapses whitespace)
+    dates = parse_multiple_dates(block.get_text(" "))
     if dates:
         return dates
     
     return []
 
 
-def parse_events_page(html: str):
-    soup = BeautifulSoup(html, "html.parser")
-    events = []
+def absolute_url(href: str) -> str:
+    """Resolve an href from a BCF page against BASE_URL."""
+    # Plain site-relative paths only need the origin prepended; urljoin handles
+    # everything else (other hosts, dot segments, relative paths)
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return BASE_URL + href
+    return urljoin(BASE_URL, href)
+
+
+def _entry_link_id(href: str) -> Optional[str]:
+    """Return the event id of a relative entry-list link, or None for any other href."""
+    if href.startswith(ENTRIES_PATH):
+        tail = href[len(ENTRIES_PATH):]
+        if tail.isdecimal():
+            return tail
+    return None
 
-    container = soup.find("div", id="events") or soup.find(id="events")
+
+def parse_events_page(html: str):
+    soup = BeautifulSoup(html, "lxml", parse_only=_EVENTS_PAGE_STRAINER)
+    # Events keyed by id; the first block seen for an id wins
+    events = {}
+
+    # Ids are unique in practice, so this one lookup usually settles it; a <div> still
+    # wins if a page repeats the id
+    container = soup.find(id="events")
+    if container is not None and container.name != "div":
+        container = soup.find("div", id="events") or container
+    # Dates found per enclosing block, valid for this soup only
+    date_cache = {}
+    # Preceding-heading context per block, built on first use
+    heading_index = None
 
     def extract_event_from_block(block):
+        nonlocal heading_index
         detail_link = None
         event_name = None
         entry_link_tag = None
@@ -255,70 +573,65 @@ def parse_events_page(html: str):
         title_block = block.find("div", class_="title")
         if title_block:
             # Prefer an event detail link inside the title
-            for tlink in title_block.find_all("a", href=True):
-                if re.search(r"^/events/\d+", tlink.get("href", "")):
-                    detail_link = tlink
-                    event_name = " ".join(tlink.get_text(" ").split())
-                    break
+            detail_link = title_block.find("a", href=_DETAIL_HREF_RE)
+            if detail_link:
+                event_name = " ".join(detail_link.get_text(" ").split())
             # Fallback to first link text for name
             if not event_name:
                 any_link = title_block.find("a", href=True)
                 if any_link:
                     event_name = " ".join(any_link.get_text(" ").split())
 
-        # Scan all links in the block to find event id and entry list link
-        for a in block.find_all("a", href=True):
-            href = a.get("href", "")
+        # Scan the event-related links in the block to find event id and entry list link
+        for a in block.find_all("a", href=_EVENT_ID_RE):
+            href = a["href"]
             if not event_id:
-                m = (re.search(r"/events/(\d+)", href)
-                     or re.search(r"/tournament/register/(\d+)", href)
-                     or re.search(r"/tournament/entries/(\d+)", href))
-                if m:
-                    event_id = m.group(1)
-            if not entry_link_tag and re.match(r"^/tournament/entries/\d+$", href):
+                event_id = _EVENT_ID_RE.search(href).group(1)
+            if not entry_link_tag and _entry_link_id(href):
                 entry_link_tag = a
 
+        if not event_id and not entry_link_tag:
+            return
+        if not event_id:
+            event_id = _entry_link_id(entry_link_tag["href"])
+        if event_id in events:
+            return
+
         if not event_name:
-            event_name = nearest_heading_text(block) or "Unknown Event"
+            if heading_index is None:
+                heading_index = index_preceding_headings(soup, blocks)
+            event_name = nearest_heading_text(block, heading_index.get(id(block))) or "Unknown Event"
 
         # Choose an anchor near the date (detail link or any link), fallback to the block itself
         anchor_for_date = detail_link or entry_link_tag or block
-        date_values = find_event_dates(anchor_for_date)
+        date_values = find_event_dates(anchor_for_date, date_cache)
 
-        event_detail_url = urljoin(BASE_URL, detail_link["href"]) if detail_link else None
+        event_detail_url = absolute_url(detail_link["href"]) if detail_link else None
         if entry_link_tag:
-            entry_list_url = urljoin(BASE_URL, entry_link_tag["href"])
-        elif event_id:
-            entry_list_url = urljoin(BASE_URL, f"/tournament/entries/{event_id}")
+            entry_list_url = absolute_url(entry_link_tag["href"])
         else:
-            entry_list_url = None
-
-        if event_id or entry_list_url:
-            events.append(
-                {
-                    "event_id": event_id or (re.search(r"/entries/(\d+)", entry_link_tag["href"]).group(1) if entry_link_tag else ""),
-                    "name": event_name,
-                    "dates": [d.isoformat() for d in date_values] if date_values else [],
-                    "event_detail_url": event_detail_url,
-                    "entry_list_url": entry_list_url,
-                }
-            )
+            entry_list_url = f"{BASE_URL}{ENTRIES_PATH}{event_id}"
+
+        events[event_id] = {
+            "event_id": event_id,
+            "name": event_name,
+            "dates": [d.isoformat() for d in date_values] if date_values else [],
+            "event_detail_url": event_detail_url,
+            "entry_list_url": entry_list_url,
+        }
 
     if container:
         # Treat each direct child of the container as an event block
-        for child in container.find_all(recursive=False):
-            if getattr(child, "name", None):
-                extract_event_from_block(child)
+        blocks = [child for child in container.children if getattr(child, "name", None)]
+        for child in blocks:
+            extract_event_from_block(child)
 
-    unique_by_id = {}
-    for ev in events:
-        unique_by_id.setdefault(ev["event_id"], ev)
-    return list(unique_by_id.values())
+    return list(events.values())
 
 
 def parse_event_details(html: str):
     """Parse detailed event information from event detail page."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_EVENT_DETAILS_STRAINER)
     details = {}
     
     # Try to extract event name from the page title or main heading
@@ -371,54 +684,101 @@ def parse_event_details(html: str):
     return details
 
 
+def _entry_list_event_name(title_text: str):
+    """Extract the event name from an entry list page title."""
+    # Extract event name from title like "Registration List • Unrated Friday Night Blitz • Boylston Chess Foundation"
+    if "•" in title_text:
+        parts = [part.strip() for part in title_text.split("•")]
+        if len(parts) >= 2:
+            return parts[1]  # Second part should be the event name
+    elif "Registration List" in title_text:
+        # Fallback: try to extract from "Registration List &bull; Event Name &bull; Boylston Chess Foundation"
+        match = _REGISTRATION_TITLE_RE.search(title_text)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def normalize_name(name: str) -> str:
+    return _WS_RE.sub(" ", (name or "").strip())
+
+
+# bs4's get_text leaves out the contents of these tags
+_NON_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+
+def _text_pieces(elem):
+    """Yield the text strings under an lxml element in document order, like itertext()
+    but skipping comments and script/style/template contents (their tails are kept)."""
+    if elem.text:
+        yield elem.text
+    for child in elem:
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _text_pieces(child)
+        if child.tail:
+            yield child.tail
+
+
+def _lxml_text(elem) -> str:
+    # Same result as bs4's get_text(" ").strip()
+    parts = []
+    for text in _text_pieces(elem):
+        # BeautifulSoup collapses whitespace-only strings to a single newline or space
+        if not text.strip(" \t\n\r\f"):
+            text = "\n" if "\n" in text else " "
+        parts.append(text)
+    return " ".join(parts).strip()
+
+
 def parse_entry_list(html: str):
     """Parse entry list from tournament entries page."""
-    soup = BeautifulSoup(html, "html.parser")
+    # Names are normalized as rows are read; the first row for a name wins
     participants = []
-    
-    # Extract event name from page title
+    seen = set()
     event_name = None
-    title_tag = soup.find("title")
-    if title_tag:
-        title_text = title_tag.get_text(" ").strip()
-        # Extract event name from title like "Registration List • Unrated Friday Night Blitz • Boylston Chess Foundation"
-        if "•" in title_text:
-            parts = [part.strip() for part in title_text.split("•")]
-            if len(parts) >= 2:
-                event_name = parts[1]  # Second part should be the event name
-        elif "Registration List" in title_text:
-            # Fallback: try to extract from "Registration List &bull; Event Name &bull; Boylston Chess Foundation"
-            match = re.search(r"Registration List[^•]*•\s*([^•]+)\s*•", title_text)
-            if match:
-                event_name = match.group(1).strip()
-
-    # First, try to find the specific "members" table (BCF format)
-    members_table = soup.find("table", id="members")
-    if members_table:
-        rows = members_table.find_all("tr")
-        if len(rows) > 1:  # Has header and data rows
-            for tr in rows[1:]:  # Skip header row
-                cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
-                if len(cells) >= 6:  # Should have #, Name, Rating, USCF ID, Section, Byes
-                    # Skip the first cell (row number)
-                    name = cells[1] if len(cells) > 1 else ""
-                    rating = cells[2] if len(cells) > 2 else ""
-                    uscf_id = cells[3] if len(cells) > 3 else ""
-                    section = cells[4] if len(cells) > 4 else ""
-                    byes = cells[5] if len(cells) > 5 else ""
-                    
-                    if name and name.strip():
-                        participant_info = {
-                            "name": name.strip(),
-                            "rating": rating.strip() if rating else None,
-                            "uscf_id": uscf_id.strip() if uscf_id else None,
-                            "section": section.strip() if section else None,
-                            "byes": byes.strip() if byes else None,
-                        }
-                        participants.append(participant_info)
+
+    # The BCF "members" table is read straight from the lxml tree; BeautifulSoup is
+    # only needed for the heuristic fallback below
+    try:
+        # Fed as UTF-8 bytes: lxml refuses str input that carries an XML encoding declaration
+        doc = lxml_html.document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError:
+        doc = None
+
+    if doc is not None:
+        title_tag = doc.find(".//title")
+        if title_tag is not None:
+            event_name = _entry_list_event_name(_lxml_text(title_tag))
+
+        members_table = doc.find('.//table[@id="members"]')
+        if members_table is not None:
+            rows = list(members_table.iter("tr"))
+            if len(rows) > 1:  # Has header and data rows
+                for tr in rows[1:]:  # Skip header row
+                    cells = [_lxml_text(c) for c in tr.iter("td", "th")]
+                    if len(cells) >= 6:  # Should have #, Name, Rating, USCF ID, Section, Byes
+                        # Skip the first cell (row number)
+                        name, rating, uscf_id, section, byes = cells[1:6]
+                        name = normalize_name(name)
+                        if name and name not in seen:
+                            seen.add(name)
+                            participants.append({
+                                "name": name,
+                                "rating": rating or None,
+                                "uscf_id": uscf_id or None,
+                                "section": section or None,
+                                "byes": byes or None,
+                            })
 
     # If no participants found in members table, try other approaches
     if not participants:
+        # Only the title and tables are ever inspected, so skip building the rest of the tree
+        soup = BeautifulSoup(html, "lxml", parse_only=_ENTRY_LIST_STRAINER)
+        if doc is None:
+            title_tag = soup.find("title")
+            if title_tag:
+                event_name = _entry_list_event_name(title_tag.get_text(" ").strip())
+
         # Look for any table with entry list structure
         for table in soup.find_all("table"):
             rows = table.find_all("tr")
@@ -427,55 +787,80 @@ def parse_entry_list(html: str):
                 
             # Check if this looks like an entry list table
             header_row = rows[0]
-            header_cells = [c.get_text(" ").strip().lower() for c in header_row.find_all(["td", "th"])]
+            header_text = " ".join(header_row.stripped_strings).lower()
             
             # More specific check for entry list headers
-            if any(keyword in " ".join(header_cells) for keyword in ["name", "player", "entrant", "entry", "participant"]):
+            if any(keyword in header_text for keyword in _ENTRY_HEADER_KEYWORDS):
                 # This is likely the entry list table
                 for tr in rows[1:]:  # Skip header row
                     cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
                     if len(cells) >= 2:
                         name = cells[1] if len(cells) > 1 else cells[0]  # Try second cell first, then first
+                        name_lower = name.lower()
                         # More strict filtering to avoid navigation items
                         if (name and len(name) > 1 and 
-                            name.lower() not in ["name", "player", "entrant", "entry", "#", "no", "yes"] and
-                            not re.search(r"^\d+$", name) and  # Not just a number
+                            name_lower not in _NON_NAME_CELLS and
+                            not _DIGITS_RE.search(name) and  # Not just a number
                             len(name.split()) <= 4 and  # Reasonable name length
-                            not any(nav_word in name.lower() for nav_word in ["home", "about", "contact", "login", "register", "search", "menu", "navigation"])):
-                            
-                            # Extract additional info if available
-                            participant_info = {
+                            not any(nav_word in name_lower for nav_word in _NAV_WORDS)):
+                            name = normalize_name(name)
+                            if name in seen:
+                                continue
+                            seen.add(name)
+
+                            # Extract additional info if available; missing cells become None
+                            extra = cells[2:6]
+                            extra += [None] * (4 - len(extra))
+                            rating, uscf_id, section, byes = extra
+                            participants.append({
                                 "name": name,
-                                "rating": cells[2] if len(cells) > 2 else None,
-                                "uscf_id": cells[3] if len(cells) > 3 else None,
-                                "section": cells[4] if len(cells) > 4 else None,
-                                "byes": cells[5] if len(cells) > 5 else None,
-                            }
-                            participants.append(participant_info)
-
-    def normalize_name(name: str) -> str:
-        return re.sub(r"\s+", " ", (name or "").strip())
-
-    # Normalize names and return
-    for p in participants:
-        p["name"] = normalize_name(p["name"])
-    
-    # Remove duplicates
-    seen = set()
-    unique_participants = []
-    for p in participants:
-        if p["name"] not in seen:
-            seen.add(p["name"])
-            unique_participants.append(p)
-    
-    return unique_participants, event_name
+                                "rating": rating,
+                                "uscf_id": uscf_id,
+                                "section": section,
+                                "byes": byes,
+                            })
+
+    return participants, event_name
+
+
+def json_loads(raw: bytes):
+    """Decode UTF-8 JSON bytes, using orjson when it is installed."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def json_dumps(data) -> bytes:
+    """Encode data as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def load_snapshot(path: str):
     if not os.path.exists(path):
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def normalize_participants(participants: list) -> list:
+    """Coerce bare-name entries from older snapshots into participant dicts."""
+    return [
+        p if isinstance(p, dict)
+        else {"name": p, "rating": None, "uscf_id": None, "section": None, "byes": None}
+        for p in participants
+    ]
+
+
+def load_participants(path: str) -> list:
+    """Return the participant list stored in a snapshot, or [] if there is none."""
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+    except FileNotFoundError:
+        return []
+    if not isinstance(data, dict):
+        return []
+    return normalize_participants(data.get("participants", []))
 
 
 def save_snapshot(path: str, data: dict):
@@ -483,64 +868,47 @@ def save_snapshot(path: str, data: dict):
     if dirname:
         os.makedirs(dirname, exist_ok=True)
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(data))
     os.replace(tmp, path)
 
 
 def diff_lists(old_list, new_list):
     """Compare old and new participant lists and return added/removed participants."""
-    # Convert to sets of names for comparison
-    old_names = set()
-    new_names = set()
-    
-    if old_list:
-        for p in old_list:
-            if isinstance(p, dict):
-                old_names.add(p["name"])
-            else:
-                old_names.add(p)
-    
-    if new_list:
-        for p in new_list:
-            if isinstance(p, dict):
-                new_names.add(p["name"])
-            else:
-                new_names.add(p)
-    
-    added_names = sorted(new_names - old_names)
-    removed_names = sorted(old_names - new_names)
-    
-    # Convert back to full participant info
-    added = []
-    removed = []
-    
-    if new_list:
-        for p in new_list:
-            name = p["name"] if isinstance(p, dict) else p
-            if name in added_names:
-                added.append(p)
-    
-    if old_list:
-        for p in old_list:
-            name = p["name"] if isinstance(p, dict) else p
-            if name in removed_names:
-                removed.append(p)
-    
+    old_list = old_list or []
+    new_list = new_list or []
+    # One set of names per side; membership checks below are then O(1)
+    old_names = {p["name"] for p in old_list}
+    new_names = {p["name"] for p in new_list}
+
+    # Keep full participant info, in the order each list reports it
+    added = [p for p in new_list if p["name"] not in old_names]
+    removed = [p for p in old_list if p["name"] not in new_names]
     return added, removed
 
 
-def within_days(event_dates: list, days_before: int) -> bool:
+def local_today():
+    """Return today's date in the local timezone."""
+    return datetime.now(timezone.utc).astimezone().date()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(date_str: str):
+    """Parse a stored YYYY-MM-DD date; snapshots share a handful of dates."""
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def within_days(event_dates: list, days_before: int, today=None) -> bool:
     """Check if any of the event dates are within the monitoring window."""
     if not event_dates:
         return False
     
-    today = datetime.now(timezone.utc).astimezone().date()
+    if today is None:
+        today = local_today()
     
     for date_str in event_dates:
         try:
-            # Parse ISO date string (YYYY-MM-DD format)
-            event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            event_date = _parse_iso_date(date_str)
             if event_date >= today and (event_date - today).days <= days_before:
                 return True
         except Exception:
@@ -548,17 +916,17 @@ def within_days(event_dates: list, days_before: int) -> bool:
     return False
 
 
-def expired(event_dates: list) -> bool:
+def expired(event_dates: list, today=None) -> bool:
     """Check if all event dates have passed."""
     if not event_dates:
         return True
     
-    today = datetime.now(timezone.utc).astimezone().date()
+    if today is None:
+        today = local_today()
     
     for date_str in event_dates:
         try:
-            # Parse ISO date string (YYYY-MM-DD format)
-            event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            event_date = _parse_iso_date(date_str)
             if event_date >= today:
                 return False  # At least one date is in the future
         except Exception:
@@ -566,22 +934,45 @@ def expired(event_dates: list) -> bool:
     return True  # All dates are in the past or invalid
 
 
-def cleanup_expired(data_dir: str):
+def read_snapshot_dates(path: str):
+    """Return a snapshot's event_dates, or None if the snapshot is empty.
+
+    event_dates is written near the top of every snapshot, so it is normally
+    read from the first few KB without decoding the participant list.
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNAPSHOT_PEEK_BYTES)
+        m = _SNAPSHOT_DATES_RE.search(head)
+        if m:
+            try:
+                return json_loads(m.group(1))
+            except ValueError:
+                pass
+        snap = json_loads(head + f.read())
+    if not snap:
+        return None
+    return snap.get("event_dates", [])
+
+
+def cleanup_expired(data_dir: str, today=None):
     if not os.path.isdir(data_dir):
         return
-    for fn in os.listdir(data_dir):
-        if not fn.endswith(".json"):
-            continue
-        path = os.path.join(data_dir, fn)
-        try:
-            snap = load_snapshot(path)
-            if not snap:
+    if today is None:
+        today = local_today()
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
                 continue
-            if expired(snap.get("event_dates", [])):
-                os.remove(path)
-                print(f"[INFO] removed expired snapshot {fn}")
-        except Exception:
-            pass
+            try:
+                event_dates = read_snapshot_dates(entry.path)
+                if event_dates is None:
+                    continue
+                if expired(event_dates, today):
+                    os.remove(entry.path)
+                    print(f"[INFO] removed expired snapshot {entry.name}")
+            except Exception:
+                pass
+    prune_http_cache(os.path.join(data_dir, HTTP_CACHE_DIRNAME))
 
 
 def send_email_notification(reports: list, email_config: dict):
@@ -590,34 +981,37 @@ def send_email_notification(reports: list, email_config: dict):
         return False
     
     try:
+        now = datetime.now()
+        sent_at = now.strftime('%Y-%m-%d %H:%M:%S')
+
         # Create message with plain text and HTML alternatives
         msg = MIMEMultipart('alternative')
         msg['From'] = email_config.get("from", EMAIL_FROM)
         msg['To'] = email_config.get("to")
-        msg['Subject'] = f"BCF Events Update - {datetime.now().strftime('%Y-%m-%d')}"
+        msg['Subject'] = f"BCF Events Update - {now.strftime('%Y-%m-%d')}"
         
-        # Create plain text body
-        text_body = f"BCF Events Monitor Update\n"
-        text_body += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        text_body += "=" * 50 + "\n\n"
+        # Create plain text body (collected as parts and joined once at the end)
+        text_body = [f"BCF Events Monitor Update\n"]
+        text_body.append(f"Date: {sent_at}\n")
+        text_body.append("=" * 50 + "\n\n")
 
         # Create HTML body
         html_body = []
         html_body.append("<html><body>")
-        html_body.append(f"<p><strong>BCF Events Monitor Update</strong><br/>Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
+        html_body.append(f"<p><strong>BCF Events Monitor Update</strong><br/>Date: {sent_at}</p>")
         html_body.append("<hr/>")
         
         if not reports:
-            text_body += "No events found within the monitoring window.\n"
+            text_body.append("No events found within the monitoring window.\n")
             html_body.append("<p>No events found within the monitoring window.</p>")
         else:
             for r in reports:
                 # Title line with link in HTML; plain text shows URL inline
                 if r.get("detail_url"):
-                    text_body += f"📅 {r['name']} - {r['detail_url']}\n"
+                    text_body.append(f"📅 {r['name']} - {r['detail_url']}\n")
                     html_body.append(f"<p>📅 <a href=\"{r['detail_url']}\">{r['name']}</a></p>")
                 else:
-                    text_body += f"📅 {r['name']}\n"
+                    text_body.append(f"📅 {r['name']}\n")
                     html_body.append(f"<p>📅 {r['name']}</p>")
 
                 # Format dates - single date or list
@@ -629,8 +1023,8 @@ def send_email_notification(reports: list, email_config: dict):
                 else:
                     date_display = "TBD"
                 
-                text_body += f"   Date: {date_display}\n"
-                text_body += f"   Participants: {r['count']}\n"
+                text_body.append(f"   Date: {date_display}\n")
+                text_body.append(f"   Participants: {r['count']}\n")
                 html_body.append(f"<div>Date: {date_display}</div>")
                 html_body.append(f"<div>Participants: {r['count']}</div>")
                 
@@ -639,59 +1033,54 @@ def send_email_notification(reports: list, email_config: dict):
                 
                 # Show changes
                 if r["added"]:
-                    text_body += f"   ✅ New participants:\n"
+                    text_body.append(f"   ✅ New participants:\n")
                     html_body.append("<div>✅ New participants:</div><ul>")
                     for p in r["added"]:
-                        if isinstance(p, dict):
-                            rating_info = f" ({p['rating']})" if p.get("rating") else ""
-                            section_info = f" [{p['section']}]" if p.get("section") else ""
-                            text_body += f"      • {p['name']}{rating_info}{section_info}\n"
-                            html_body.append(f"<li>{p['name']}{rating_info}{section_info}</li>")
-                        else:
-                            text_body += f"      • {p}\n"
-                            html_body.append(f"<li>{p}</li>")
+                        rating_info = f" ({p['rating']})" if p.get("rating") else ""
+                        section_info = f" [{p['section']}]" if p.get("section") else ""
+                        text_body.append(f"      • {p['name']}{rating_info}{section_info}\n")
+                        html_body.append(f"<li>{p['name']}{rating_info}{section_info}</li>")
                     html_body.append("</ul>")
                 
                 if r["removed"]:
-                    text_body += f"   ❌ Withdrawn participants:\n"
+                    text_body.append(f"   ❌ Withdrawn participants:\n")
                     html_body.append("<div>❌ Withdrawn participants:</div><ul>")
                     for p in r["removed"]:
-                        if isinstance(p, dict):
-                            rating_info = f" ({p['rating']})" if p.get("rating") else ""
-                            section_info = f" [{p['section']}]" if p.get("section") else ""
-                            text_body += f"      • {p['name']}{rating_info}{section_info}\n"
-                            html_body.append(f"<li>{p['name']}{rating_info}{section_info}</li>")
-                        else:
-                            text_body += f"      • {p}\n"
-                            html_body.append(f"<li>{p}</li>")
+                        rating_info = f" ({p['rating']})" if p.get("rating") else ""
+                        section_info = f" [{p['section']}]" if p.get("section") else ""
+                        text_body.append(f"      • {p['name']}{rating_info}{section_info}\n")
+                        html_body.append(f"<li>{p['name']}{rating_info}{section_info}</li>")
                     html_body.append("</ul>")
 
                 # Only show Entry List if there are participants
                 if r['count'] > 0:
-                    text_body += f"   📝 Entry List: {r['entry_url']}\n\n"
+                    text_body.append(f"   📝 Entry List: {r['entry_url']}\n\n")
                     html_body.append(f"<div>📝 Entry List: <a href=\"{r['entry_url']}\">{r['entry_url']}</a></div>")
                 else:
-                    text_body += "\n"
+                    text_body.append("\n")
 
         html_body.append("<hr/>")
         html_body.append("<div>This is an automated message from BCF Events Monitor.</div>")
         html_body.append("</body></html>")
         
-        text_body += "\n" + "=" * 50 + "\n"
-        text_body += "This is an automated message from BCF Events Monitor.\n"
+        text_body.append("\n" + "=" * 50 + "\n")
+        text_body.append("This is an automated message from BCF Events Monitor.\n")
         
-        msg.attach(MIMEText(text_body, 'plain'))
+        msg.attach(MIMEText("".join(text_body), 'plain'))
         msg.attach(MIMEText("\n".join(html_body), 'html'))
         
-        # Send email
-        server = smtplib.SMTP(email_config.get("smtp_server", EMAIL_SMTP_SERVER), 
-                              email_config.get("smtp_port", EMAIL_SMTP_PORT))
-        server.starttls()
-        server.login(email_config.get("username", EMAIL_USERNAME), 
-                     email_config.get("password", EMAIL_PASSWORD))
-        text = msg.as_string()
-        server.sendmail(msg['From'], msg['To'], text)
-        server.quit()
+        # Send email; port 465 is implicit TLS, other ports upgrade with STARTTLS
+        smtp_server = email_config.get("smtp_server", EMAIL_SMTP_SERVER)
+        smtp_port = email_config.get("smtp_port", EMAIL_SMTP_PORT)
+        if str(smtp_port) == "465":
+            server = smtplib.SMTP_SSL(smtp_server, smtp_port)
+        else:
+            server = smtplib.SMTP(smtp_server, smtp_port)
+            server.starttls()
+        with server:
+            server.login(email_config.get("username", EMAIL_USERNAME), 
+                         email_config.get("password", EMAIL_PASSWORD))
+            server.sendmail(msg['From'], msg['To'], msg.as_bytes())
         
         print(f"[INFO] Email notification sent to {email_config.get('to')}")
         return True
@@ -709,6 +1098,40 @@ def has_significant_changes(reports: list) -> bool:
     return False
 
 
+# Kept line for line in step with _keyword_trie_pattern in bcf_monitor/monitor.py
+def keyword_trie_pattern(keywords) -> str:
+    """Build a regex source matching any of ``keywords``, with shared prefixes factored out.
+
+    ("blitz", "bullet", "quads" -> ``(?:b(?:litz|ullet)|quads)``), so the regex engine
+    tries each leading character once instead of once per keyword.
+    """
+    trie = {}
+    for word in keywords:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def pattern(node):
+        if "" in node:
+            # A keyword ends here; any longer keyword through this node is redundant
+            # for a substring search
+            return ""
+        alternatives = [re.escape(ch) + pattern(child) for ch, child in sorted(node.items())]
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return pattern(trie)
+
+
+def compile_keywords(keywords):
+    """Compile title keywords into one case-insensitive pattern, or None if there are none."""
+    if not keywords:
+        return None
+    return re.compile(keyword_trie_pattern(keywords), re.I)
+
+
 def load_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict[str, Any]:
     """Load configuration from JSON file."""
     default_config = {
@@ -733,8 +1156,8 @@ def load_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict[str, Any]:
         return default_config
     
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        with open(config_file, "rb") as f:
+            config = json_loads(f.read())
         
         # Merge with defaults to ensure all keys exist
         merged_config = default_config.copy()
@@ -753,8 +1176,8 @@ def load_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict[str, Any]:
 def save_config(config: Dict[str, Any], config_file: str = DEFAULT_CONFIG_FILE) -> bool:
     """Save configuration to JSON file."""
     try:
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        with open(config_file, "wb") as f:
+            f.write(json_dumps(config))
         return True
     except Exception as e:
         print(f"[ERROR] Failed to save config file {config_file}: {e}", file=sys.stderr)
@@ -823,6 +1246,7 @@ def main():
     
     # Load configuration from file
     config = load_config(args.config)
+    today = local_today()
     
     # Override config with command line arguments
     data_dir = args.data_dir or config.get("data_dir", "./data")
@@ -831,14 +1255,16 @@ def main():
     exclude_str = args.exclude or config.get("exclude", "")
     debug = args.debug or config.get("debug", False)
     
-    include = [s.strip().lower() for s in include_str.split(",") if s.strip()]
-    exclude = [s.strip().lower() for s in exclude_str.split(",") if s.strip()]
+    include = tuple(s.strip().lower() for s in include_str.split(",") if s.strip())
+    exclude = tuple(s.strip().lower() for s in exclude_str.split(",") if s.strip())
+    include_re = compile_keywords(include)
+    exclude_re = compile_keywords(exclude)
 
     def match_rules(name: str) -> bool:
-        lower = (name or "").lower()
-        if include and not any(k in lower for k in include):
+        name = name or ""
+        if include_re and not include_re.search(name):
             return False
-        if exclude and any(k in lower for k in exclude):
+        if exclude_re and exclude_re.search(name):
             return False
         return True
 
@@ -864,8 +1290,9 @@ def main():
             print("[ERROR] Email notifications enabled but SMTP credentials not specified. Use --email-username/--email-password or set BCF_EMAIL_USERNAME/BCF_EMAIL_PASSWORD environment variables.", file=sys.stderr)
             sys.exit(1)
 
+    cache_dir = os.path.join(data_dir, HTTP_CACHE_DIRNAME)
     try:
-        events_html = http_get(EVENTS_URL, insecure=True)
+        events_html = http_get_cached(EVENTS_URL, cache_dir, EVENTS_PAGE_CACHE_TTL_SECONDS, insecure=True)
     except Exception as e:
         print(f"[ERR] fetch events page failed: {e}", file=sys.stderr)
         sys.exit(2)
@@ -875,17 +1302,33 @@ def main():
     events = parse_events_page(events_html)
     if not events:
         print("[INFO] No events discovered on events listing page.")
-        cleanup_expired(data_dir)
+        cleanup_expired(data_dir, today)
         return
 
+    # Detail pages only fill in dates the listing lacks, so an event whose listing
+    # dates are already outside the window can skip both fetches
+    events = [e for e in events if not e.get("dates") or within_days(e["dates"], days_before, today)]
+
+    # Detail pages and entry lists are independent of each other, so fetch them all
+    # concurrently up front; the loop below only parses and diffs
+    pages = fetch_all(
+        [e.get("event_detail_url") for e in events] + [e["entry_list_url"] for e in events],
+        insecure=True,
+        cache_dir=cache_dir,
+        ttls=[DETAIL_PAGE_CACHE_TTL_SECONDS] * len(events) + [None] * len(events),
+    )
+    detail_pages, entry_pages = pages[:len(events)], pages[len(events):]
+
     reports = []
-    for e in events:
+    for e, detail_page, entry_page in zip(events, detail_pages, entry_pages):
         event_details = {}
         
-        # Fetch event details if URL is available
+        # Parse event details if URL is available
         if e.get("event_detail_url"):
             try:
-                detail_html = http_get(e["event_detail_url"], insecure=True)
+                if isinstance(detail_page, Exception):
+                    raise detail_page
+                detail_html = detail_page
                 event_details = parse_event_details(detail_html)
                 # Use event name from details if available and better than the one from events page
                 if event_details.get("event_name") and event_details["event_name"].lower() not in ["upcoming events", "events", "tournaments"]:
@@ -903,7 +1346,9 @@ def main():
         
         # Fetch entry list
         try:
-            entry_html = http_get(e["entry_list_url"], insecure=True)
+            if isinstance(entry_page, Exception):
+                raise entry_page
+            entry_html = entry_page
             participants, entry_event_name = parse_entry_list(entry_html)
             
             # Use event name from entry list if available and better than current name
@@ -916,7 +1361,7 @@ def main():
                 continue
 
             # Now that we've attempted to populate dates, apply the date window filter
-            if not within_days(e.get("dates", []), days_before):
+            if not within_days(e.get("dates", []), days_before, today):
                 # Skip events outside the monitoring window
                 continue
             
@@ -933,8 +1378,7 @@ def main():
             continue
 
         snap_path = os.path.join(data_dir, f"{e['event_id']}.json")
-        previous = load_snapshot(snap_path) or {}
-        prev_participants = previous.get("participants", [])
+        prev_participants = load_participants(snap_path)
         added, removed = diff_lists(prev_participants, participants)
 
         snapshot = {
@@ -965,20 +1409,20 @@ def main():
 
     if not reports:
         print("[INFO] No events within window matching rules.")
-        cleanup_expired(data_dir)
+        cleanup_expired(data_dir, today)
         return
 
     today_str = datetime.now().strftime("%Y-%m-%d")
-    print(f"BCF event updates ({today_str})")
-    print("=" * 50)
+    # Build the report as one list of lines and write it in a single call
+    lines = [f"BCF event updates ({today_str})", "=" * 50]
     
     for r in reports:
         delta = f"(+{len(r['added'])} -{len(r['removed'])})" if (r["added"] or r["removed"]) else "(no changes)"
         # Make title clickable if detail_url exists by printing URL on same line
         if r.get("detail_url"):
-            print(f"\n📅 {r['name']} - {r['detail_url']}")
+            lines.append(f"\n📅 {r['name']} - {r['detail_url']}")
         else:
-            print(f"\n📅 {r['name']}")
+            lines.append(f"\n📅 {r['name']}")
         
         # Format dates - single date or list
         dates = r.get("dates", [])
@@ -989,37 +1433,32 @@ def main():
         else:
             date_display = "TBD"
         
-        print(f"   Date: {date_display}")
-        print(f"   Participants: {r['count']} {delta}")
+        lines.append(f"   Date: {date_display}")
+        lines.append(f"   Participants: {r['count']} {delta}")
         
         # Show key event details if available
         # Note: Entry Fee, Time Control, and Sections fields removed per user request
         
         if r["added"]:
-            print(f"   ✅ New participants:")
+            lines.append(f"   ✅ New participants:")
             for p in r["added"]:
-                if isinstance(p, dict):
-                    rating_info = f" ({p['rating']})" if p.get("rating") else ""
-                    section_info = f" [{p['section']}]" if p.get("section") else ""
-                    print(f"      • {p['name']}{rating_info}{section_info}")
-                else:
-                    print(f"      • {p}")
+                rating_info = f" ({p['rating']})" if p.get("rating") else ""
+                section_info = f" [{p['section']}]" if p.get("section") else ""
+                lines.append(f"      • {p['name']}{rating_info}{section_info}")
         
         if r["removed"]:
-            print(f"   ❌ Withdrawn participants:")
+            lines.append(f"   ❌ Withdrawn participants:")
             for p in r["removed"]:
-                if isinstance(p, dict):
-                    rating_info = f" ({p['rating']})" if p.get("rating") else ""
-                    section_info = f" [{p['section']}]" if p.get("section") else ""
-                    print(f"      • {p['name']}{rating_info}{section_info}")
-                else:
-                    print(f"      • {p}")
+                rating_info = f" ({p['rating']})" if p.get("rating") else ""
+                section_info = f" [{p['section']}]" if p.get("section") else ""
+                lines.append(f"      • {p['name']}{rating_info}{section_info}")
         
         # Only show Entry List if there are participants
         if r['count'] > 0:
-            print(f"   📝 Entry List: {r['entry_url']}")
+            lines.append(f"   📝 Entry List: {r['entry_url']}")
     
-    print("\n" + "=" * 50)
+    lines.append("\n" + "=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Send email notification if enabled
     if email_config["enabled"]:
@@ -1031,7 +1470,7 @@ def main():
         if should_send:
             send_email_notification(reports, email_config)
 
-    cleanup_expired(data_dir)
+    cleanup_expired(data_dir, today)
 
 
 if __name__ == "__main__":
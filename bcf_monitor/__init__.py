@@ -8,12 +8,32 @@ and sending email notifications.
 __version__ = "1.0.0"
 __author__ = "BCF Events Monitor Team"
 
-# Import main classes for easy access
+# Import main classes for easy access. Config is cheap; the rest pull in
+# requests, BeautifulSoup and lxml, so they are loaded on first access
 from .config import Config
-from .monitor import BCFMonitor
-from .http_client import HTTPClient
-from .parsers import EventParser, EntryListParser, DateParser
-from .email_notifier import EmailNotifier
+
+_LAZY_IMPORTS = {
+    'BCFMonitor': '.monitor',
+    'HTTPClient': '.http_client',
+    'EventParser': '.parsers',
+    'EntryListParser': '.parsers',
+    'DateParser': '.parsers',
+    'EmailNotifier': '.email_notifier',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     'Config',
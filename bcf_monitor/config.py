@@ -5,11 +5,29 @@ This module handles loading, saving, and validating configuration settings
 from JSON files and environment variables.
 """
 
+import copy
 import json
 import os
 import sys
 from typing import Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
+
+def json_loads(raw: bytes) -> Any:
+    """Decode UTF-8 JSON bytes, using orjson when it is installed."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class Config:
     """Configuration manager for BCF Events Monitor."""
@@ -54,13 +72,14 @@ class Config:
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file and environment variables."""
-        config = self.DEFAULT_CONFIG.copy()
+        # Deep copy: the nested "email" dict is updated in place below
+        config = copy.deepcopy(self.DEFAULT_CONFIG)
         
         # Load from file if it exists
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    file_config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    file_config = json_loads(f.read())
                 
                 # Merge file config with defaults
                 config.update(file_config)
@@ -129,8 +148,8 @@ class Config:
             True if successful, False otherwise
         """
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            with open(self.config_file, "wb") as f:
+                f.write(json_dumps(self._config))
             return True
         except Exception as e:
             print(f"[ERROR] Failed to save config file {self.config_file}: {e}", file=sys.stderr)
@@ -149,7 +168,7 @@ class Config:
                 "You can still override these settings using command line arguments.",
                 "Remove the _comment and _instructions fields when you're done configuring."
             ],
-            **self.DEFAULT_CONFIG
+            **copy.deepcopy(self.DEFAULT_CONFIG)
         }
         
         # Update email config with example values
@@ -161,8 +180,8 @@ class Config:
         })
         
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(default_config, f, indent=2, ensure_ascii=False)
+            with open(self.config_file, "wb") as f:
+                f.write(json_dumps(default_config))
             return True
         except Exception as e:
             print(f"[ERROR] Failed to create config file {self.config_file}: {e}", file=sys.stderr)
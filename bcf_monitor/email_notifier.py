@@ -8,9 +8,8 @@ with both plain text and HTML formatting.
 import smtplib
 import sys
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any, Tuple
+from email.message import EmailMessage
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class EmailNotifier:
@@ -24,13 +23,18 @@ class EmailNotifier:
         """
         self.config = config
         self.enabled = config.get("enabled", False)
-        self.to = config.get("to", "")
+        # "to" may be a single address, a comma-separated string or a list
+        to = config.get("to") or ""
+        self.recipients = [addr.strip() for addr in (to.split(",") if isinstance(to, str) else to)
+                           if addr and addr.strip()]
+        self.to = ", ".join(self.recipients)
         self.from_addr = config.get("from", "")
         self.smtp_server = config.get("smtp_server", "smtp.gmail.com")
         self.smtp_port = config.get("smtp_port", 587)
         self.username = config.get("username", "")
         self.password = config.get("password", "")
         self.only_changes = config.get("only_changes", True)
+        self._smtp = None
     
     def is_enabled(self) -> bool:
         """Check if email notifications are enabled.
@@ -43,7 +47,13 @@ class EmailNotifier:
                 bool(self.username) and 
                 bool(self.password))
     
-    def has_significant_changes(self, reports: List[Dict[str, Any]]) -> bool:
+    @staticmethod
+    def _report_has_changes(report: Dict[str, Any]) -> bool:
+        """Check if a single report has any added or removed participants."""
+        return bool(report.get("added") or report.get("removed"))
+    
+    @staticmethod
+    def has_significant_changes(reports: List[Dict[str, Any]]) -> bool:
         """Check if there are any significant changes worth notifying about.
         
         Args:
@@ -52,10 +62,7 @@ class EmailNotifier:
         Returns:
             True if there are significant changes
         """
-        for report in reports:
-            if report.get("added") or report.get("removed"):
-                return True
-        return False
+        return any(map(EmailNotifier._report_has_changes, reports))
     
     def should_send_notification(self, reports: List[Dict[str, Any]]) -> bool:
         """Determine if a notification should be sent.
@@ -88,85 +95,167 @@ class EmailNotifier:
         
         try:
             # Create message with plain text and HTML alternatives
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage()
             msg['From'] = self.from_addr
-            msg['To'] = self.to
-            msg['Subject'] = f"BCF Events Update - {datetime.now().strftime('%Y-%m-%d')}"
+            # Multiple recipients get one message via the SMTP envelope (Bcc),
+            # so the header names the sender rather than exposing the list
+            msg['To'] = self.to if len(self.recipients) == 1 else self.from_addr
+            now = datetime.now()
+            msg['Subject'] = f"BCF Events Update - {now.strftime('%Y-%m-%d')}"
             
             # Create message body
-            text_body, html_body = self._create_message_bodies(reports)
+            text_body, html_body = self._create_message_bodies(reports, now)
             
-            msg.attach(MIMEText(text_body, 'plain'))
-            msg.attach(MIMEText(html_body, 'html'))
+            msg.set_content(text_body)
+            msg.add_alternative(html_body, subtype='html')
             
-            # Send email
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
-            text = msg.as_string()
-            server.sendmail(self.from_addr, self.to, text)
-            server.quit()
+            # Send email (the envelope carries every recipient, not the To: header)
+            server = self._get_smtp()
+            server.send_message(msg, from_addr=self.from_addr, to_addrs=self.recipients)
             
             print(f"[INFO] Email notification sent to {self.to}")
             return True
             
         except Exception as e:
             print(f"[ERROR] Failed to send email notification: {e}", file=sys.stderr)
+            self._discard_smtp()
             return False
     
-    def _create_message_bodies(self, reports: List[Dict[str, Any]]) -> Tuple[str, str]:
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP connection, reusing the open one while it is alive.
+        
+        Returns:
+            Connected and authenticated SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._discard_smtp()
+        
+        # Port 465 is implicit TLS; other ports upgrade with STARTTLS
+        implicit_tls = str(self.smtp_port) == "465"
+        smtp_class = smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP
+        server = smtp_class(self.smtp_server, self.smtp_port)
+        try:
+            if not implicit_tls:
+                server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def _discard_smtp(self) -> None:
+        """Drop the pooled SMTP connection without talking to the server."""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+    
+    def close(self) -> None:
+        """Log out of and close the pooled SMTP connection, if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self._discard_smtp()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def _create_message_bodies(self, reports: List[Dict[str, Any]],
+                               now: Optional[datetime] = None) -> Tuple[str, str]:
         """Create both plain text and HTML message bodies.
         
         Args:
             reports: List of event reports
+            now: Time to stamp the message with (defaults to the current time)
             
         Returns:
             Tuple of (text_body, html_body)
         """
+        now_str = (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+        
+        # With only_changes, unchanged events are left out of the message entirely
+        if self.only_changes:
+            reports = [r for r in reports if self._report_has_changes(r)]
+        
         # Create plain text body
-        text_body = f"BCF Events Monitor Update\n"
-        text_body += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        text_body += "=" * 50 + "\n\n"
+        text_body = []
+        text_body.append(f"BCF Events Monitor Update\n")
+        text_body.append(f"Date: {now_str}\n")
+        text_body.append("=" * 50 + "\n\n")
         
         # Create HTML body
         html_body = []
         html_body.append("<html><body>")
-        html_body.append(f"<p><strong>BCF Events Monitor Update</strong><br/>Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
+        html_body.append(f"<p><strong>BCF Events Monitor Update</strong><br/>Date: {now_str}</p>")
         html_body.append("<hr/>")
         
         if not reports:
-            text_body += "No events found within the monitoring window.\n"
+            text_body.append("No events found within the monitoring window.\n")
             html_body.append("<p>No events found within the monitoring window.</p>")
         else:
             for report in reports:
-                text_body += self._format_report_text(report)
-                html_body.append(self._format_report_html(report))
+                # Format each participant line once for both bodies
+                added = [self._format_participant(p) for p in report.get("added") or ()]
+                removed = [self._format_participant(p) for p in report.get("removed") or ()]
+                text_body.append(self._format_report_text(report, added, removed))
+                html_body.append(self._format_report_html(report, added, removed))
         
         html_body.append("<hr/>")
         html_body.append("<div>This is an automated message from BCF Events Monitor.</div>")
         html_body.append("</body></html>")
         
-        text_body += "\n" + "=" * 50 + "\n"
-        text_body += "This is an automated message from BCF Events Monitor.\n"
+        text_body.append("\n" + "=" * 50 + "\n")
+        text_body.append("This is an automated message from BCF Events Monitor.\n")
         
-        return text_body, "\n".join(html_body)
+        return "".join(text_body), "\n".join(html_body)
     
-    def _format_report_text(self, report: Dict[str, Any]) -> str:
+    @staticmethod
+    def _format_participant(participant: Dict[str, Any]) -> str:
+        """Format a participant as "Name (rating) [section]".
+        
+        Args:
+            participant: Participant dictionary
+            
+        Returns:
+            Formatted participant string
+        """
+        rating = participant.get("rating")
+        section = participant.get("section")
+        rating_info = f" ({rating})" if rating else ""
+        section_info = f" [{section}]" if section else ""
+        return f"{participant['name']}{rating_info}{section_info}"
+    
+    def _format_report_text(self, report: Dict[str, Any], added: List[str], removed: List[str]) -> str:
         """Format a single report for plain text.
         
         Args:
             report: Event report dictionary
+            added: Formatted new participants
+            removed: Formatted withdrawn participants
             
         Returns:
             Formatted text string
         """
-        text = ""
+        text_parts = []
         
         # Title line with link
         if report.get("detail_url"):
-            text += f"📅 {report['name']} - {report['detail_url']}\n"
+            text_parts.append(f"📅 {report['name']} - {report['detail_url']}\n")
         else:
-            text += f"📅 {report['name']}\n"
+            text_parts.append(f"📅 {report['name']}\n")
         
         # Format dates
         dates = report.get("dates", [])
@@ -177,43 +266,35 @@ class EmailNotifier:
         else:
             date_display = "TBD"
         
-        text += f"   Date: {date_display}\n"
-        text += f"   Participants: {report['count']}\n"
+        text_parts.append(f"   Date: {date_display}\n")
+        text_parts.append(f"   Participants: {report['count']}\n")
         
         # Show changes
-        if report.get("added"):
-            text += f"   ✅ New participants:\n"
-            for participant in report["added"]:
-                if isinstance(participant, dict):
-                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                    text += f"      • {participant['name']}{rating_info}{section_info}\n"
-                else:
-                    text += f"      • {participant}\n"
-        
-        if report.get("removed"):
-            text += f"   ❌ Withdrawn participants:\n"
-            for participant in report["removed"]:
-                if isinstance(participant, dict):
-                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                    text += f"      • {participant['name']}{rating_info}{section_info}\n"
-                else:
-                    text += f"      • {participant}\n"
+        if added:
+            text_parts.append(f"   ✅ New participants:\n")
+            for participant in added:
+                text_parts.append(f"      • {participant}\n")
+        
+        if removed:
+            text_parts.append(f"   ❌ Withdrawn participants:\n")
+            for participant in removed:
+                text_parts.append(f"      • {participant}\n")
         
         # Only show Entry List if there are participants
         if report['count'] > 0:
-            text += f"   📝 Entry List: {report['entry_url']}\n\n"
+            text_parts.append(f"   📝 Entry List: {report['entry_url']}\n\n")
         else:
-            text += "\n"
+            text_parts.append("\n")
         
-        return text
+        return "".join(text_parts)
     
-    def _format_report_html(self, report: Dict[str, Any]) -> str:
+    def _format_report_html(self, report: Dict[str, Any], added: List[str], removed: List[str]) -> str:
         """Format a single report for HTML.
         
         Args:
             report: Event report dictionary
+            added: Formatted new participants
+            removed: Formatted withdrawn participants
             
         Returns:
             Formatted HTML string
@@ -239,26 +320,16 @@ class EmailNotifier:
         html_parts.append(f"<div>Participants: {report['count']}</div>")
         
         # Show changes
-        if report.get("added"):
+        if added:
             html_parts.append("<div>✅ New participants:</div><ul>")
-            for participant in report["added"]:
-                if isinstance(participant, dict):
-                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                    html_parts.append(f"<li>{participant['name']}{rating_info}{section_info}</li>")
-                else:
-                    html_parts.append(f"<li>{participant}</li>")
+            for participant in added:
+                html_parts.append(f"<li>{participant}</li>")
             html_parts.append("</ul>")
         
-        if report.get("removed"):
+        if removed:
             html_parts.append("<div>❌ Withdrawn participants:</div><ul>")
-            for participant in report["removed"]:
-                if isinstance(participant, dict):
-                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                    html_parts.append(f"<li>{participant['name']}{rating_info}{section_info}</li>")
-                else:
-                    html_parts.append(f"<li>{participant}</li>")
+            for participant in removed:
+                html_parts.append(f"<li>{participant}</li>")
             html_parts.append("</ul>")
         
         # Only show Entry List if there are participants
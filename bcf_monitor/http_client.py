@@ -5,9 +5,18 @@ This module provides a clean interface for making HTTP requests
 with proper error handling and configuration.
 """
 
+import hashlib
+import os
+import time
+
 import certifi
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
+
+from .config import json_dumps, json_loads
 
 
 class HTTPClient:
@@ -29,6 +38,18 @@ class HTTPClient:
         self.verify_ssl = verify_ssl
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": self.user_agent})
+        # Verification is settled once here so every request carries the same
+        # setting and urllib3 keeps a single connection pool for the host
+        self.session.verify = certifi.where() if verify_ssl else False
+        # Every request goes to the same host; keep enough keep-alive
+        # connections for get_many() workers to reuse instead of reconnecting
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def get(self, url: str, insecure: bool = False) -> str:
         """Make a GET request to the specified URL.
@@ -43,7 +64,7 @@ class HTTPClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        verify = False if insecure else (certifi.where() if self.verify_ssl else False)
+        verify = False if insecure else self.session.verify
         
         response = self.session.get(
             url,
@@ -53,6 +74,133 @@ class HTTPClient:
         response.raise_for_status()
         return response.text
     
+    def get_cached(self, url: str, cache_dir: str, ttl_seconds: int = 0,
+                   insecure: bool = False) -> str:
+        """Make a GET request through an on-disk cache in ``cache_dir``.
+        
+        A copy younger than ``ttl_seconds`` is returned without a request. An
+        older copy is revalidated with the ETag/Last-Modified the server sent,
+        so an unchanged page costs a 304 instead of a full download.
+        
+        Args:
+            url: URL to request
+            cache_dir: Directory holding cached bodies and their validators
+            ttl_seconds: How long a cached copy is used without revalidating
+            insecure: If True, disable SSL verification
+            
+        Returns:
+            Response text content
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        base = os.path.join(cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest())
+        body_path, meta_path = base + ".html", base + ".meta.json"
+        try:
+            age = time.time() - os.path.getmtime(body_path)
+            with open(body_path, "r", encoding="utf-8") as f:
+                cached = f.read()
+        except OSError:
+            age, cached = None, None
+        if cached is not None and age < ttl_seconds:
+            return cached
+        
+        headers = {}
+        if cached is not None:
+            try:
+                with open(meta_path, "rb") as f:
+                    meta = json_loads(f.read())
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+            except (OSError, ValueError):
+                pass
+        
+        response = self.session.get(
+            url,
+            headers=headers,
+            timeout=self.timeout,
+            verify=False if insecure else self.session.verify
+        )
+        if response.status_code == 304 and cached is not None:
+            try:
+                os.utime(body_path)
+            except OSError:
+                pass
+            return cached
+        response.raise_for_status()
+        text = response.text
+        
+        # A failed cache write only costs a full download next time
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = body_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, body_path)
+            with open(meta_path, "wb") as f:
+                f.write(json_dumps({
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }))
+        except OSError:
+            pass
+        return text
+    
+    @staticmethod
+    def prune_cache(cache_dir: str, max_age_seconds: int) -> None:
+        """Delete entries from a ``get_cached`` cache that have gone stale.
+        
+        A 304 touches the cached body, so the body's mtime decides for the
+        whole entry; its validators (and any stray temp file) go with it.
+        
+        Args:
+            cache_dir: Directory passed to get_cached
+            max_age_seconds: Entries not fetched or revalidated for this long are removed
+        """
+        cutoff = time.time() - max_age_seconds
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = [(e.name, e.path, e.stat().st_mtime) for e in it if e.is_file()]
+        except OSError:
+            return
+        live = {name[:-len(".html")] for name, _, mtime in entries
+                if name.endswith(".html") and mtime >= cutoff}
+        for name, path, mtime in entries:
+            if mtime < cutoff and name.split(".", 1)[0] not in live:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def get_many(self, urls: List[Optional[str]], insecure: bool = False,
+                 max_workers: int = 8) -> List[Union[str, Exception, None]]:
+        """Fetch several URLs concurrently over the shared session.
+        
+        Args:
+            urls: URLs to request; empty entries are skipped
+            insecure: If True, disable SSL verification
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            One result per URL, in order: the response text, the exception
+            raised while fetching it, or None for an empty entry
+        """
+        def fetch_one(url):
+            if not url:
+                return None
+            try:
+                return self.get(url, insecure=insecure)
+            except Exception as e:
+                return e
+        
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+            return list(pool.map(fetch_one, urls))
+    
     def close(self):
         """Close the HTTP session."""
         self.session.close()
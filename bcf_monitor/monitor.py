@@ -6,22 +6,64 @@ all the different components to monitor BCF events.
 """
 
 import os
+import re
 import sys
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
 
-from .config import Config
+from .config import Config, json_dumps, json_loads
 from .http_client import HTTPClient
 from .parsers import EventParser, EntryListParser, DateParser
 from .email_notifier import EmailNotifier
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso_date(date_str: str) -> date:
+    """Parse a stored YYYY-MM-DD date; events and snapshots share a handful of dates."""
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+# Kept line for line in step with keyword_trie_pattern in bcf_monitor.py
+def _keyword_trie_pattern(keywords) -> str:
+    """Build a regex source matching any of ``keywords``, with shared prefixes factored out.
+
+    ("blitz", "bullet", "quads" -> ``(?:b(?:litz|ullet)|quads)``), so the regex engine
+    tries each leading character once instead of once per keyword.
+    """
+    trie = {}
+    for word in keywords:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def pattern(node):
+        if "" in node:
+            # A keyword ends here; any longer keyword through this node is redundant
+            # for a substring search
+            return ""
+        alternatives = [re.escape(ch) + pattern(child) for ch, child in sorted(node.items())]
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return pattern(trie)
+
+
 class BCFMonitor:
     """Main monitoring class for BCF Events Monitor."""
     
     # Constants
     BASE_URL = "https://boylstonchess.org"
     EVENTS_URL = "https://boylstonchess.org/events"
+    SNAPSHOT_PEEK_BYTES = 4096
+    # The events listing is cached under <data_dir>/.cache (shared with the legacy script)
+    HTTP_CACHE_DIRNAME = ".cache"
+    EVENTS_PAGE_CACHE_TTL_SECONDS = 300
+    # Cached pages not fetched or revalidated for this long are pruned during cleanup
+    HTTP_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+    _SNAPSHOT_DATES_RE = re.compile(rb'"event_dates"\s*:\s*(\[[^\]]*\])')
     
     def __init__(self, config: Config):
         """Initialize the BCF monitor.
@@ -33,6 +75,9 @@ class BCFMonitor:
         self.data_dir = config.get("data_dir", "./data")
         self.days_before = config.get("days_before", 7)
         self.debug = config.get("debug", False)
+        # Set once per run()
+        self._today = None
+        self._checked_at = None
         
         # Initialize components
         self.http_client = HTTPClient()
@@ -50,6 +95,22 @@ class BCFMonitor:
         
         self.include_keywords = [s.strip().lower() for s in include_str.split(",") if s.strip()]
         self.exclude_keywords = [s.strip().lower() for s in exclude_str.split(",") if s.strip()]
+        self._include_re = self._compile_keywords(self.include_keywords)
+        self._exclude_re = self._compile_keywords(self.exclude_keywords)
+    
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> Optional[re.Pattern]:
+        """Compile keywords into one substring pattern with shared prefixes factored out.
+        
+        Args:
+            keywords: Lowercased keywords
+            
+        Returns:
+            Compiled pattern, or None if there are no keywords
+        """
+        if not keywords:
+            return None
+        return re.compile(_keyword_trie_pattern(keywords))
     
     def _match_rules(self, name: str) -> bool:
         """Check if event name matches include/exclude rules.
@@ -63,21 +124,27 @@ class BCFMonitor:
         lower_name = (name or "").lower()
         
         # Check include rules
-        if self.include_keywords and not any(k in lower_name for k in self.include_keywords):
+        if self._include_re and not self._include_re.search(lower_name):
             return False
         
         # Check exclude rules
-        if self.exclude_keywords and any(k in lower_name for k in self.exclude_keywords):
+        if self._exclude_re and self._exclude_re.search(lower_name):
             return False
         
         return True
     
-    def _within_days(self, event_dates: List[str], days_before: int) -> bool:
+    @staticmethod
+    def _local_today() -> date:
+        """Return today's date in the local timezone."""
+        return datetime.now(timezone.utc).astimezone().date()
+    
+    def _within_days(self, event_dates: List[str], days_before: int, today: Optional[date] = None) -> bool:
         """Check if any of the event dates are within the monitoring window.
         
         Args:
             event_dates: List of ISO date strings
             days_before: Number of days before event to start monitoring
+            today: Reference date (defaults to today's local date)
             
         Returns:
             True if event is within monitoring window
@@ -85,22 +152,24 @@ class BCFMonitor:
         if not event_dates:
             return False
         
-        today = datetime.now(timezone.utc).astimezone().date()
+        if today is None:
+            today = self._local_today()
         
         for date_str in event_dates:
             try:
-                event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+                event_date = _parse_iso_date(date_str)
                 if event_date >= today and (event_date - today).days <= days_before:
                     return True
             except Exception:
                 continue
         return False
     
-    def _expired(self, event_dates: List[str]) -> bool:
+    def _expired(self, event_dates: List[str], today: Optional[date] = None) -> bool:
         """Check if all event dates have passed.
         
         Args:
             event_dates: List of ISO date strings
+            today: Reference date (defaults to today's local date)
             
         Returns:
             True if all dates are in the past
@@ -108,11 +177,12 @@ class BCFMonitor:
         if not event_dates:
             return True
         
-        today = datetime.now(timezone.utc).astimezone().date()
+        if today is None:
+            today = self._local_today()
         
         for date_str in event_dates:
             try:
-                event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+                event_date = _parse_iso_date(date_str)
                 if event_date >= today:
                     return False  # At least one date is in the future
             except Exception:
@@ -128,12 +198,9 @@ class BCFMonitor:
         Returns:
             Snapshot data or None if file doesn't exist
         """
-        if not os.path.exists(path):
-            return None
         try:
-            import json
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return json_loads(f.read())
         except Exception:
             return None
     
@@ -144,19 +211,31 @@ class BCFMonitor:
             path: Path to save snapshot
             data: Snapshot data to save
         """
-        dirname = os.path.dirname(path)
-        if dirname:
-            os.makedirs(dirname, exist_ok=True)
-        
+        # The data directory itself is created once per run, in run()
         tmp = path + ".tmp"
         try:
-            import json
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(json_dumps(data))
             os.replace(tmp, path)
         except Exception as e:
             print(f"[ERROR] Failed to save snapshot {path}: {e}", file=sys.stderr)
     
+    @staticmethod
+    def _normalize_participants(participants: List[Any]) -> List[Dict[str, Any]]:
+        """Coerce bare-name entries from older snapshots into participant dicts.
+        
+        Args:
+            participants: Participant list as stored in a snapshot
+            
+        Returns:
+            Participant list where every entry is a dict
+        """
+        return [
+            p if isinstance(p, dict)
+            else {"name": p, "rating": None, "uscf_id": None, "section": None, "byes": None}
+            for p in participants
+        ]
+    
     def _diff_lists(self, old_list: List[Dict[str, Any]], new_list: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Compare old and new participant lists and return added/removed participants.
         
@@ -167,65 +246,69 @@ class BCFMonitor:
         Returns:
             Tuple of (added_participants, removed_participants)
         """
-        # Convert to sets of names for comparison
-        old_names = set()
-        new_names = set()
-        
-        if old_list:
-            for p in old_list:
-                if isinstance(p, dict):
-                    old_names.add(p["name"])
-                else:
-                    old_names.add(p)
-        
-        if new_list:
-            for p in new_list:
-                if isinstance(p, dict):
-                    new_names.add(p["name"])
-                else:
-                    new_names.add(p)
-        
-        added_names = sorted(new_names - old_names)
-        removed_names = sorted(old_names - new_names)
-        
-        # Convert back to full participant info
-        added = []
-        removed = []
-        
-        if new_list:
-            for p in new_list:
-                name = p["name"] if isinstance(p, dict) else p
-                if name in added_names:
-                    added.append(p)
-        
-        if old_list:
-            for p in old_list:
-                name = p["name"] if isinstance(p, dict) else p
-                if name in removed_names:
-                    removed.append(p)
+        old_list = old_list or []
+        new_list = new_list or []
+        
+        # One set of names per side; membership checks below are then O(1)
+        old_names = {p["name"] for p in old_list}
+        new_names = {p["name"] for p in new_list}
+        
+        # Keep full participant info, in the order each list reports it
+        added = [p for p in new_list if p["name"] not in old_names]
+        removed = [p for p in old_list if p["name"] not in new_names]
         
         return added, removed
     
     def _cleanup_expired(self) -> None:
-        """Remove expired event snapshots."""
+        """Remove expired event snapshots and stale HTTP cache entries."""
         if not os.path.isdir(self.data_dir):
             return
         
-        for filename in os.listdir(self.data_dir):
-            if not filename.endswith(".json"):
-                continue
-            
-            path = os.path.join(self.data_dir, filename)
-            try:
-                snapshot = self._load_snapshot(path)
-                if not snapshot:
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
                     continue
                 
-                if self._expired(snapshot.get("event_dates", [])):
-                    os.remove(path)
-                    print(f"[INFO] removed expired snapshot {filename}")
-            except Exception:
-                pass
+                try:
+                    event_dates = self._read_snapshot_dates(entry.path)
+                    if event_dates is None:
+                        continue
+                    
+                    if self._expired(event_dates, self._today):
+                        os.remove(entry.path)
+                        print(f"[INFO] removed expired snapshot {entry.name}")
+                except Exception:
+                    pass
+        
+        self.http_client.prune_cache(
+            os.path.join(self.data_dir, self.HTTP_CACHE_DIRNAME),
+            self.HTTP_CACHE_MAX_AGE_SECONDS,
+        )
+    
+    def _read_snapshot_dates(self, path: str) -> Optional[List[str]]:
+        """Read just the event dates from a snapshot.
+        
+        event_dates is written near the top of every snapshot, so it is normally
+        found in the first few KB without decoding the participant list.
+        
+        Args:
+            path: Path to snapshot file
+            
+        Returns:
+            The snapshot's event dates, or None if the snapshot is empty
+        """
+        with open(path, "rb") as f:
+            head = f.read(self.SNAPSHOT_PEEK_BYTES)
+            match = self._SNAPSHOT_DATES_RE.search(head)
+            if match:
+                try:
+                    return json_loads(match.group(1))
+                except ValueError:
+                    pass
+            snapshot = json_loads(head + f.read())
+        if not snapshot:
+            return None
+        return snapshot.get("event_dates", [])
     
     def _fetch_events_page(self) -> str:
         """Fetch the main events page.
@@ -237,16 +320,25 @@ class BCFMonitor:
             Exception: If fetching fails
         """
         try:
-            return self.http_client.get(self.EVENTS_URL, insecure=True)
+            return self.http_client.get_cached(
+                self.EVENTS_URL,
+                os.path.join(self.data_dir, self.HTTP_CACHE_DIRNAME),
+                self.EVENTS_PAGE_CACHE_TTL_SECONDS,
+                insecure=True,
+            )
         except Exception as e:
             print(f"[ERR] fetch events page failed: {e}", file=sys.stderr)
             raise
     
-    def _process_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _process_event(self, event: Dict[str, Any],
+                       detail_result: Union[str, Exception, None],
+                       entry_result: Union[str, Exception]) -> Optional[Dict[str, Any]]:
         """Process a single event and return report.
         
         Args:
             event: Event dictionary from events page
+            detail_result: Detail page HTML, or the exception raised fetching it
+            entry_result: Entry list HTML, or the exception raised fetching it
             
         Returns:
             Event report dictionary or None if event should be skipped
@@ -254,11 +346,12 @@ class BCFMonitor:
         event_id = event["event_id"]
         event_details = {}
         
-        # Fetch event details if URL is available
+        # Parse event details if URL is available
         if event.get("event_detail_url"):
             try:
-                detail_html = self.http_client.get(event["event_detail_url"], insecure=True)
-                event_details = self.event_parser.parse_event_details(detail_html)
+                if isinstance(detail_result, Exception):
+                    raise detail_result
+                event_details = self.event_parser.parse_event_details(detail_result)
                 
                 # Use event name from details if available and better
                 if (event_details.get("event_name") and 
@@ -276,9 +369,11 @@ class BCFMonitor:
             except Exception as ex:
                 print(f"[WARN] fetch event details failed for {event_id}: {ex}", file=sys.stderr)
         
-        # Fetch entry list
+        # Parse entry list
         try:
-            entry_html = self.http_client.get(event["entry_list_url"], insecure=True)
+            if isinstance(entry_result, Exception):
+                raise entry_result
+            entry_html = entry_result
             participants, entry_event_name = self.entry_parser.parse_entry_list(entry_html)
             
             # Use event name from entry list if available and better
@@ -292,7 +387,7 @@ class BCFMonitor:
                 return None
             
             # Apply the date window filter
-            if not self._within_days(event.get("dates", []), self.days_before):
+            if not self._within_days(event.get("dates", []), self.days_before, self._today):
                 return None
             
             if not participants:
@@ -312,7 +407,7 @@ class BCFMonitor:
         # Load previous snapshot and compare
         snap_path = os.path.join(self.data_dir, f"{event_id}.json")
         previous = self._load_snapshot(snap_path) or {}
-        prev_participants = previous.get("participants", [])
+        prev_participants = self._normalize_participants(previous.get("participants", []))
         added, removed = self._diff_lists(prev_participants, participants)
         
         # Save new snapshot
@@ -323,7 +418,7 @@ class BCFMonitor:
             "event_detail_url": event.get("event_detail_url"),
             "entry_list_url": event["entry_list_url"],
             "event_details": event_details,
-            "last_checked": datetime.now().isoformat(timespec="seconds"),
+            "last_checked": self._checked_at or datetime.now().isoformat(timespec="seconds"),
             "participants": participants,
             "count": len(participants),
         }
@@ -352,17 +447,19 @@ class BCFMonitor:
             return
         
         today_str = datetime.now().strftime("%Y-%m-%d")
-        print(f"BCF event updates ({today_str})")
-        print("=" * 50)
+        # Collect the whole report and write it to stdout in one go
+        lines = []
+        lines.append(f"BCF event updates ({today_str})")
+        lines.append("=" * 50)
         
         for report in reports:
             delta = f"(+{len(report['added'])} -{len(report['removed'])})" if (report["added"] or report["removed"]) else "(no changes)"
             
             # Print title with link if available
             if report.get("detail_url"):
-                print(f"\n📅 {report['name']} - {report['detail_url']}")
+                lines.append(f"\n📅 {report['name']} - {report['detail_url']}")
             else:
-                print(f"\n📅 {report['name']}")
+                lines.append(f"\n📅 {report['name']}")
             
             # Format dates
             dates = report.get("dates", [])
@@ -373,38 +470,35 @@ class BCFMonitor:
             else:
                 date_display = "TBD"
             
-            print(f"   Date: {date_display}")
-            print(f"   Participants: {report['count']} {delta}")
+            lines.append(f"   Date: {date_display}")
+            lines.append(f"   Participants: {report['count']} {delta}")
             
             # Show changes
             if report["added"]:
-                print(f"   ✅ New participants:")
+                lines.append(f"   ✅ New participants:")
                 for participant in report["added"]:
-                    if isinstance(participant, dict):
-                        rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                        section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                        print(f"      • {participant['name']}{rating_info}{section_info}")
-                    else:
-                        print(f"      • {participant}")
+                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
+                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
+                    lines.append(f"      • {participant['name']}{rating_info}{section_info}")
             
             if report["removed"]:
-                print(f"   ❌ Withdrawn participants:")
+                lines.append(f"   ❌ Withdrawn participants:")
                 for participant in report["removed"]:
-                    if isinstance(participant, dict):
-                        rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
-                        section_info = f" [{participant['section']}]" if participant.get("section") else ""
-                        print(f"      • {participant['name']}{rating_info}{section_info}")
-                    else:
-                        print(f"      • {participant}")
+                    rating_info = f" ({participant['rating']})" if participant.get("rating") else ""
+                    section_info = f" [{participant['section']}]" if participant.get("section") else ""
+                    lines.append(f"      • {participant['name']}{rating_info}{section_info}")
             
             # Only show Entry List if there are participants
             if report['count'] > 0:
-                print(f"   📝 Entry List: {report['entry_url']}")
+                lines.append(f"   📝 Entry List: {report['entry_url']}")
         
-        print("\n" + "=" * 50)
+        lines.append("\n" + "=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run(self) -> None:
         """Run the monitoring process."""
+        self._today = self._local_today()
+        self._checked_at = datetime.now().isoformat(timespec="seconds")
         try:
             # Fetch events page
             events_html = self._fetch_events_page()
@@ -416,10 +510,23 @@ class BCFMonitor:
                 self._cleanup_expired()
                 return
             
-            # Process each event
+            # Detail pages only fill in dates the listing lacks, so an event whose
+            # listing dates are already outside the window can skip both fetches
+            events = [e for e in events
+                      if not e.get("dates") or self._within_days(e["dates"], self.days_before, self._today)]
+            
+            os.makedirs(self.data_dir, exist_ok=True)
+            
+            # Fetch every detail page and entry list concurrently, then
+            # process the events one by one in listing order
+            urls = [e.get("event_detail_url") for e in events] + [e["entry_list_url"] for e in events]
+            results = self.http_client.get_many(urls, insecure=True)
+            detail_results = results[:len(events)]
+            entry_results = results[len(events):]
+            
             reports = []
-            for event in events:
-                report = self._process_event(event)
+            for event, detail_result, entry_result in zip(events, detail_results, entry_results):
+                report = self._process_event(event, detail_result, entry_result)
                 if report:
                     reports.append(report)
             
@@ -445,3 +552,4 @@ class BCFMonitor:
             sys.exit(1)
         finally:
             self.http_client.close()
+            self.email_notifier.close()
@@ -5,11 +5,80 @@ This module contains all the HTML parsing logic for extracting event information
 participant data, and other details from the BCF website.
 """
 
+import calendar
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
+
+# Precompiled regular expressions used by the parsers
+_WS_RE = re.compile(r"\s+")
+_NUMERIC_DATE_RE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+_MONTH_YEAR_RE = re.compile(r"([A-Za-z]+).*?(\d{4})")
+_WEEKDAY_PREFIX_RE = re.compile(r"^[A-Za-z]+,\s*")
+_DAY_NUMBER_RE = re.compile(r"\b(\d{1,2})\b")
+_DIGITS_RE = re.compile(r"^\d+$")
+_DATE_LABEL_RE = re.compile(r"^date$", re.I)
+_DATE_LABEL_STR_RE = re.compile(r"^\s*Date\s*$", re.I)
+_DETAIL_HREF_RE = re.compile(r"^/events/\d+")
+_ENTRIES_HREF_RE = re.compile(r"^/tournament/entries/\d+$")
+_ENTRIES_ID_RE = re.compile(r"/entries/(\d+)")
+# Any link that carries an event id (detail, registration or entry-list page)
+_EVENT_ID_RE = re.compile(r"/(?:events|tournament/register|tournament/entries)/(\d+)")
+_REGISTRATION_TITLE_RE = re.compile(r"Registration List[^•]*•\s*([^•]+)\s*•")
+
+# The DateParser.DATE_PATTERNS shapes, matched directly so well-formed dates skip strptime
+_NAMED_DATE_RE = re.compile(r"(?:([A-Za-z]+), )?([A-Za-z]+) (\d{1,2}), (\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_US_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTH_NUMBERS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
+_WEEKDAY_NAMES = frozenset(name.lower() for name in calendar.day_name)
+
+_HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5"])
+# Heading and container texts that are never an event's name
+_GENERIC_HEADINGS = frozenset(["upcoming events", "events", "tournaments", "chess events"])
+_NON_EVENT_NAME_TEXTS = _GENERIC_HEADINGS | {"register online now", "date", "time", "location"}
+
+# Entry-list table heuristics
+_ENTRY_HEADER_KEYWORDS = ("name", "player", "entrant", "entry", "participant")
+_NON_NAME_CELLS = frozenset({"name", "player", "entrant", "entry", "#", "no", "yes"})
+_NAV_WORDS = ("home", "about", "contact", "login", "register", "search", "menu", "navigation")
+
+
+# bs4's get_text leaves out the contents of these tags
+_NON_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+
+def _text_pieces(elem):
+    """Yield the text strings under an lxml element in document order, like itertext()
+    but skipping comments and script/style/template contents (their tails are kept)."""
+    if elem.text:
+        yield elem.text
+    for child in elem:
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _text_pieces(child)
+        if child.tail:
+            yield child.tail
+
+
+def _element_text(elem) -> str:
+    """Text of an lxml element; same result as bs4's get_text(" ").strip()."""
+    parts = []
+    for text in _text_pieces(elem):
+        # BeautifulSoup collapses whitespace-only strings to a single newline or space
+        if not text.strip(" \t\n\r\f"):
+            text = "\n" if "\n" in text else " "
+        parts.append(text)
+    return " ".join(parts).strip()
+
+
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+# The entry-list fallback only ever looks at the title and tables
+_ENTRY_LIST_STRAINER = SoupStrainer(["title", "table"])
 
 
 class DateParser:
@@ -34,10 +103,18 @@ class DateParser:
         """
         if not text:
             return None
-            
-        cleaned = re.sub(r"\s+", " ", text.strip())
         
-        # Try standard patterns first
+        return DateParser._parse_cleaned_date(_WS_RE.sub(" ", text.strip()))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cleaned_date(cleaned: str) -> Optional[datetime]:
+        """Parse a whitespace-normalized date string; memoized, as the same strings recur across blocks."""
+        parsed = DateParser._match_date_shape(cleaned)
+        if parsed:
+            return parsed
+        
+        # strptime still decides anything the shape patterns did not accept
         for pattern in DateParser.DATE_PATTERNS:
             try:
                 return datetime.strptime(cleaned, pattern).date()
@@ -45,17 +122,47 @@ class DateParser:
                 continue
         
         # Try regex pattern for YYYY-MM-DD or MM/DD/YYYY
-        match = re.search(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})", cleaned)
+        match = _NUMERIC_DATE_RE.search(cleaned)
         if match:
             year, month, day = map(int, match.groups())
             return datetime(year, month, day).date()
         
         return None
     
+    @staticmethod
+    def _match_date_shape(cleaned: str) -> Optional[datetime]:
+        """Build a date from a string shaped like one of DATE_PATTERNS, or return None."""
+        match = _NAMED_DATE_RE.fullmatch(cleaned)
+        if match:
+            weekday, month, day, year = match.groups()
+            if weekday is not None and weekday.lower() not in _WEEKDAY_NAMES:
+                return None
+            month_num = _MONTH_NUMBERS.get(month.lower())
+            if month_num is None:
+                return None
+            ymd = (int(year), month_num, int(day))
+        else:
+            match = _ISO_DATE_RE.fullmatch(cleaned)
+            if match:
+                ymd = tuple(map(int, match.groups()))
+            else:
+                match = _US_DATE_RE.fullmatch(cleaned)
+                if not match:
+                    return None
+                month, day, year = map(int, match.groups())
+                ymd = (year, month, day)
+        try:
+            return datetime(*ymd).date()
+        except ValueError:
+            return None
+    
     @staticmethod
     def parse_multiple_dates(text: str) -> List[datetime]:
         """Parse text that may contain multiple dates or date ranges.
         
+        Results are memoized per whitespace-normalized string, since events
+        in a series repeat the same date text.
+        
         Args:
             text: Text containing dates
             
@@ -65,11 +172,23 @@ class DateParser:
         if not text:
             return []
         
-        cleaned = re.sub(r"\s+", " ", text.strip())
+        # The cache key is the cleaned plain str; a NavigableString passed in
+        # would otherwise keep its whole soup alive in the cache
+        return list(DateParser._parse_multiple_dates_cached(_WS_RE.sub(" ", text.strip())))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_multiple_dates_cached(cleaned: str) -> Tuple[datetime, ...]:
+        """Memoized parse_multiple_dates; returns a tuple so cached results can't be mutated."""
+        return tuple(DateParser._parse_multiple_dates(cleaned))
+    
+    @staticmethod
+    def _parse_multiple_dates(cleaned: str) -> List[datetime]:
+        """Uncached implementation of parse_multiple_dates, on whitespace-normalized text."""
         dates = []
         
         # Extract month and year information first
-        month_year_match = re.search(r"([A-Za-z]+).*?(\d{4})", cleaned)
+        month_year_match = _MONTH_YEAR_RE.search(cleaned)
         if not month_year_match:
             # Fallback to single date parsing
             single_date = DateParser.parse_date(cleaned)
@@ -78,9 +197,8 @@ class DateParser:
         month_name = month_year_match.group(1)
         year = int(month_year_match.group(2))
         
-        try:
-            month_num = datetime.strptime(month_name, "%B").month
-        except ValueError:
+        month_num = _MONTH_NUMBERS.get(month_name.lower())
+        if month_num is None:
             # Fallback to single date parsing
             single_date = DateParser.parse_date(cleaned)
             return [single_date] if single_date else []
@@ -93,8 +211,8 @@ class DateParser:
                 end_text = parts[1].strip()
                 
                 # Remove day of week from start and end
-                start_clean = re.sub(r"^[A-Za-z]+,\s*", "", start_text)
-                end_clean = re.sub(r"^[A-Za-z]+,\s*", "", end_text)
+                start_clean = _WEEKDAY_PREFIX_RE.sub("", start_text)
+                end_clean = _WEEKDAY_PREFIX_RE.sub("", end_text)
                 
                 # Add year to both dates if not present
                 if str(year) not in start_clean:
@@ -110,44 +228,15 @@ class DateParser:
                 end_date = DateParser.parse_date(end_clean)
                 
                 if start_date and end_date:
-                    current = start_date
-                    while current <= end_date:
-                        dates.append(current)
-                        current += timedelta(days=1)
-                    return dates
-        
-        # Handle individual days (contains 'and' keyword)
-        elif 'and' in cleaned:
-            parts = re.split(r',\s*and\s*|,\s*', cleaned)
-            day_numbers = []
-            
-            for part in parts:
-                numbers = re.findall(r'\b(\d{1,2})\b', part)
-                for num_str in numbers:
-                    day = int(num_str)
-                    if 1 <= day <= 31 and day != year:
-                        day_numbers.append(day)
-            
-            for day in day_numbers:
-                dates.append(datetime(year, month_num, day).date())
-            
-            if dates:
-                return sorted(dates)
-        
-        # Handle comma-separated days without 'and' keyword
-        elif ',' in cleaned:
-            parts = cleaned.split(',')
-            day_numbers = []
-            
-            for part in parts:
-                numbers = re.findall(r'\b(\d{1,2})\b', part)
-                for num_str in numbers:
-                    day = int(num_str)
-                    if 1 <= day <= 31 and day != year:
-                        day_numbers.append(day)
-            
-            for day in day_numbers:
-                dates.append(datetime(year, month_num, day).date())
+                    return [start_date + timedelta(days=n) for n in range((end_date - start_date).days + 1)]
+        
+        # Handle individual days, separated by commas and/or 'and'
+        elif 'and' in cleaned or ',' in cleaned:
+            # Every standalone 1-2 digit number is a day (the year has four digits)
+            for num_str in _DAY_NUMBER_RE.findall(cleaned):
+                day = int(num_str)
+                if 1 <= day <= 31 and day != year:
+                    dates.append(datetime(year, month_num, day).date())
             
             if dates:
                 return sorted(dates)
@@ -168,21 +257,62 @@ class EventParser:
         """
         self.base_url = base_url
     
-    def find_nearest_heading_text(self, elem) -> Optional[str]:
+    def index_preceding_headings(self, soup, blocks) -> Dict[int, Tuple]:
+        """Record the headings that precede each block in a single forward pass.
+        
+        Args:
+            soup: BeautifulSoup document containing the blocks
+            blocks: Elements to record heading context for
+            
+        Returns:
+            Mapping of id(block) to (specific_heading_text, last_heading, last_strong)
+        """
+        wanted = {id(b) for b in blocks}
+        index = {}
+        specific_heading = heading = strong = None
+        for tag in soup.find_all(True):
+            if id(tag) in wanted:
+                index[id(tag)] = (specific_heading, heading, strong)
+            if tag.name in _HEADING_TAGS:
+                heading = tag
+                heading_text = " ".join(tag.get_text(" ").split())
+                if heading_text.lower() not in _GENERIC_HEADINGS:
+                    specific_heading = heading_text
+            elif tag.name == "strong":
+                strong = tag
+        return index
+    
+    @staticmethod
+    def _walk_preceding_headings(elem) -> Tuple:
+        """Walk back from elem for the same context index_preceding_headings records."""
+        heading = None
+        for h in elem.previous_elements:
+            if h.name not in _HEADING_TAGS:
+                continue
+            heading = heading or h
+            heading_text = " ".join(h.get_text(" ").split())
+            if heading_text.lower() not in _GENERIC_HEADINGS:
+                return heading_text, heading, None
+        return None, heading, elem.find_previous(["strong"])
+    
+    def find_nearest_heading_text(self, elem, preceding: Optional[Tuple] = None) -> Optional[str]:
         """Find the nearest meaningful heading text for an element.
         
         Args:
             elem: BeautifulSoup element
+            preceding: Heading context from index_preceding_headings; when
+                omitted the document is walked backwards from elem instead
             
         Returns:
             Heading text or None
         """
-        # First, try to find a more specific heading that's not generic
-        for heading in elem.find_all_previous(["h1", "h2", "h3", "h4", "h5"]):
-            heading_text = " ".join(heading.get_text(" ").split())
-            # Skip generic headings
-            if heading_text.lower() not in ["upcoming events", "events", "tournaments", "chess events"]:
-                return heading_text
+        if preceding is None:
+            preceding = self._walk_preceding_headings(elem)
+        specific_heading, heading, strong = preceding
+        
+        # First, prefer the nearest heading that's not generic
+        if specific_heading:
+            return specific_heading
         
         # If no specific heading found, try to find the event name in the link text or nearby text
         parent = elem.find_parent(["div", "section", "article", "td", "li"])
@@ -190,25 +320,25 @@ class EventParser:
             for text_elem in parent.find_all(["span", "div", "p", "strong", "b"]):
                 text = " ".join(text_elem.get_text(" ").split())
                 if (text and len(text) > 5 and 
-                    text.lower() not in ["register online now", "upcoming events", "events", "tournaments", "chess events", "date", "time", "location"] and
+                    text.lower() not in _NON_EVENT_NAME_TEXTS and
                     not text.startswith("http") and
-                    not re.match(r"^\d+$", text)):
+                    not _DIGITS_RE.match(text)):
                     return text
         
-        # Fallback to original logic
-        heading = elem.find_previous(["h1", "h2", "h3", "h4", "h5"])
+        # Fallback to the nearest heading or <strong> of any kind
         if heading:
             return " ".join(heading.get_text(" ").split())
-        strong = elem.find_previous(["strong"])
         if strong:
             return " ".join(strong.get_text(" ").split())
         return None
     
-    def find_event_dates(self, elem) -> List[datetime]:
+    def find_event_dates(self, elem, cache: Optional[Dict[int, List[datetime]]] = None) -> List[datetime]:
         """Find event dates from an element.
         
         Args:
             elem: BeautifulSoup element
+            cache: Optional dict memoizing results per enclosing block, so
+                anchors that share a block only walk it once
             
         Returns:
             List of parsed dates
@@ -216,29 +346,39 @@ class EventParser:
         block = elem.find_parent(["table", "div", "section", "article"]) or elem.parent
         if not block:
             return []
-        
+        if cache is None:
+            return self._find_block_dates(block)
+        key = id(block)
+        if key not in cache:
+            cache[key] = self._find_block_dates(block)
+        return cache[key]
+    
+    @staticmethod
+    def _find_block_dates(block) -> List[datetime]:
+        """Search a block's date rows, date labels and finally its whole text for dates."""
         # Look in table rows first
         for tr in block.find_all("tr"):
             cells = [td.get_text(" ").strip() for td in tr.find_all(["td", "th"])]
             if not cells:
                 continue
-            if re.search(r"^date$", cells[0], re.I) and len(cells) > 1:
+            if _DATE_LABEL_RE.search(cells[0]) and len(cells) > 1:
                 dates = DateParser.parse_multiple_dates(cells[1])
                 if dates:
                     return dates
         
-        # Look for date labels
-        labels = block.find_all(string=re.compile(r"^\s*Date\s*$", re.I))
-        for lab in labels:
+        # Look for date labels; a plain walk over the strings is much cheaper than
+        # find_all(string=...) matching every descendant through a SoupStrainer
+        for lab in block.descendants:
+            if not isinstance(lab, NavigableString) or not _DATE_LABEL_STR_RE.match(lab):
+                continue
             sib = lab.parent.find_next(string=True)
             if sib:
                 dates = DateParser.parse_multiple_dates(sib)
                 if dates:
                     return dates
         
-        # Look for date patterns in the text
-        txt = " ".join(block.get_text(" ").split())
-        dates = DateParser.parse_multiple_dates(txt)
+        # Look for date patterns in the text (parse_multiple_dates collapses whitespace)
+        dates = DateParser.parse_multiple_dates(block.get_text(" "))
         if dates:
             return dates
         
@@ -253,14 +393,25 @@ class EventParser:
         Returns:
             List of event dictionaries
         """
-        soup = BeautifulSoup(html, "html.parser")
-        events = []
-        
-        container = soup.find("div", id="events") or soup.find(id="events")
+        soup = BeautifulSoup(html, "lxml")
+        # Events keyed by id; the first block seen for an id wins
+        events = {}
+        
+        # Ids are unique in practice, so this one lookup usually settles it; a <div> still
+        # wins if a page repeats the id
+        container = soup.find(id="events")
+        if container is not None and container.name != "div":
+            container = soup.find("div", id="events") or container
         if not container:
-            return events
+            return []
+        
+        # Dates found per enclosing block, valid for this soup only
+        date_cache = {}
+        # Preceding-heading context per block, built on first use
+        heading_index = None
         
         def extract_event_from_block(block):
+            nonlocal heading_index
             detail_link = None
             event_name = None
             entry_link_tag = None
@@ -268,36 +419,39 @@ class EventParser:
             
             title_block = block.find("div", class_="title")
             if title_block:
-                # Prefer an event detail link inside the title
+                # Prefer an event detail link inside the title, remembering the first link on the way
+                first_link = None
                 for tlink in title_block.find_all("a", href=True):
-                    if re.search(r"^/events/\d+", tlink.get("href", "")):
+                    if first_link is None:
+                        first_link = tlink
+                    if _DETAIL_HREF_RE.search(tlink["href"]):
                         detail_link = tlink
                         event_name = " ".join(tlink.get_text(" ").split())
                         break
                 # Fallback to first link text for name
-                if not event_name:
-                    any_link = title_block.find("a", href=True)
-                    if any_link:
-                        event_name = " ".join(any_link.get_text(" ").split())
+                if not event_name and first_link is not None:
+                    event_name = " ".join(first_link.get_text(" ").split())
             
-            # Scan all links in the block to find event id and entry list link
-            for a in block.find_all("a", href=True):
-                href = a.get("href", "")
+            # Scan the event-related links in the block to find event id and entry list link
+            for a in block.find_all("a", href=_EVENT_ID_RE):
+                href = a["href"]
                 if not event_id:
-                    m = (re.search(r"/events/(\d+)", href)
-                         or re.search(r"/tournament/register/(\d+)", href)
-                         or re.search(r"/tournament/entries/(\d+)", href))
-                    if m:
-                        event_id = m.group(1)
-                if not entry_link_tag and re.match(r"^/tournament/entries/\d+$", href):
+                    event_id = _EVENT_ID_RE.search(href).group(1)
+                if not entry_link_tag and _ENTRIES_HREF_RE.match(href):
                     entry_link_tag = a
             
+            # A later block for an id already seen would be dropped, so skip its name and date lookups
+            if event_id in events:
+                return None
+            
             if not event_name:
-                event_name = self.find_nearest_heading_text(block) or "Unknown Event"
+                if heading_index is None:
+                    heading_index = self.index_preceding_headings(soup, blocks)
+                event_name = self.find_nearest_heading_text(block, heading_index.get(id(block))) or "Unknown Event"
             
             # Choose an anchor near the date (detail link or any link), fallback to the block itself
             anchor_for_date = detail_link or entry_link_tag or block
-            date_values = self.find_event_dates(anchor_for_date)
+            date_values = self.find_event_dates(anchor_for_date, date_cache)
             
             event_detail_url = urljoin(self.base_url, detail_link["href"]) if detail_link else None
             if entry_link_tag:
@@ -308,24 +462,23 @@ class EventParser:
                 entry_list_url = None
             
             if event_id or entry_list_url:
-                events.append({
-                    "event_id": event_id or (re.search(r"/entries/(\d+)", entry_link_tag["href"]).group(1) if entry_link_tag else ""),
+                return {
+                    "event_id": event_id or (_ENTRIES_ID_RE.search(entry_link_tag["href"]).group(1) if entry_link_tag else ""),
                     "name": event_name,
                     "dates": [d.isoformat() for d in date_values] if date_values else [],
                     "event_detail_url": event_detail_url,
                     "entry_list_url": entry_list_url,
-                })
+                }
+            return None
         
         # Treat each direct child of the container as an event block
-        for child in container.find_all(recursive=False):
-            if getattr(child, "name", None):
-                extract_event_from_block(child)
-        
-        # Remove duplicates by event_id
-        unique_by_id = {}
-        for ev in events:
-            unique_by_id.setdefault(ev["event_id"], ev)
-        return list(unique_by_id.values())
+        blocks = [child for child in container.children if getattr(child, "name", None)]
+        for child in blocks:
+            event = extract_event_from_block(child)
+            if event and event["event_id"] not in events:
+                events[event["event_id"]] = event
+        
+        return list(events.values())
     
     def parse_event_details(self, html: str) -> Dict[str, Any]:
         """Parse detailed event information from event detail page.
@@ -336,7 +489,7 @@ class EventParser:
         Returns:
             Dictionary of event details
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         details = {}
         
         # Try to extract event name from the page title or main heading
@@ -398,19 +551,34 @@ class EntryListParser:
         Returns:
             Tuple of (participants_list, event_name)
         """
-        soup = BeautifulSoup(html, "html.parser")
         participants = []
+        event_name = None
         
-        # Extract event name from page title
-        event_name = self._extract_event_name_from_title(soup)
-        
-        # First, try to find the specific "members" table (BCF format)
-        members_table = soup.find("table", id="members")
-        if members_table:
-            participants = self._parse_members_table(members_table)
+        # The title and the BCF "members" table are read straight from the lxml
+        # tree; BeautifulSoup is only needed for the generic-table fallback
+        try:
+            # Fed as UTF-8 bytes: lxml refuses str input that carries an XML encoding declaration
+            doc = lxml_html.document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+        except etree.ParserError:
+            doc = None
+        
+        if doc is not None:
+            title_tag = doc.find(".//title")
+            if title_tag is not None:
+                event_name = self._extract_event_name_from_title(_element_text(title_tag))
+            
+            # First, try to find the specific "members" table (BCF format)
+            members_table = doc.find('.//table[@id="members"]')
+            if members_table is not None:
+                participants = self._parse_members_table(members_table)
         
         # If no participants found in members table, try other approaches
         if not participants:
+            soup = BeautifulSoup(html, "lxml", parse_only=_ENTRY_LIST_STRAINER)
+            if doc is None:
+                title_tag = soup.find("title")
+                if title_tag:
+                    event_name = self._extract_event_name_from_title(title_tag.get_text(" ").strip())
             participants = self._parse_generic_tables(soup)
         
         # Normalize names and remove duplicates
@@ -418,14 +586,8 @@ class EntryListParser:
         
         return participants, event_name
     
-    def _extract_event_name_from_title(self, soup) -> Optional[str]:
-        """Extract event name from page title."""
-        title_tag = soup.find("title")
-        if not title_tag:
-            return None
-            
-        title_text = title_tag.get_text(" ").strip()
-        
+    def _extract_event_name_from_title(self, title_text: str) -> Optional[str]:
+        """Extract event name from page title text."""
         # Extract event name from title like "Registration List • Unrated Friday Night Blitz • Boylston Chess Foundation"
         if "•" in title_text:
             parts = [part.strip() for part in title_text.split("•")]
@@ -433,34 +595,31 @@ class EntryListParser:
                 return parts[1]  # Second part should be the event name
         elif "Registration List" in title_text:
             # Fallback: try to extract from "Registration List &bull; Event Name &bull; Boylston Chess Foundation"
-            match = re.search(r"Registration List[^•]*•\s*([^•]+)\s*•", title_text)
+            match = _REGISTRATION_TITLE_RE.search(title_text)
             if match:
                 return match.group(1).strip()
         
         return None
     
     def _parse_members_table(self, table) -> List[Dict[str, Any]]:
-        """Parse the specific members table format."""
+        """Parse the specific members table format from its lxml element."""
         participants = []
-        rows = table.find_all("tr")
+        rows = list(table.iter("tr"))
         
         if len(rows) > 1:  # Has header and data rows
             for tr in rows[1:]:  # Skip header row
-                cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
+                cells = list(tr.iter("td", "th"))
                 if len(cells) >= 6:  # Should have #, Name, Rating, USCF ID, Section, Byes
-                    name = cells[1] if len(cells) > 1 else ""
-                    rating = cells[2] if len(cells) > 2 else ""
-                    uscf_id = cells[3] if len(cells) > 3 else ""
-                    section = cells[4] if len(cells) > 4 else ""
-                    byes = cells[5] if len(cells) > 5 else ""
+                    # Skip the first cell (row number); cell text is already stripped
+                    name, rating, uscf_id, section, byes = map(_element_text, cells[1:6])
                     
-                    if name and name.strip():
+                    if name:
                         participants.append({
-                            "name": name.strip(),
-                            "rating": rating.strip() if rating else None,
-                            "uscf_id": uscf_id.strip() if uscf_id else None,
-                            "section": section.strip() if section else None,
-                            "byes": byes.strip() if byes else None,
+                            "name": name,
+                            "rating": rating or None,
+                            "uscf_id": uscf_id or None,
+                            "section": section or None,
+                            "byes": byes or None,
                         })
         
         return participants
@@ -476,21 +635,22 @@ class EntryListParser:
                 
             # Check if this looks like an entry list table
             header_row = rows[0]
-            header_cells = [c.get_text(" ").strip().lower() for c in header_row.find_all(["td", "th"])]
+            header_text = " ".join(c.get_text(" ").strip() for c in header_row.find_all(["td", "th"])).lower()
             
             # More specific check for entry list headers
-            if any(keyword in " ".join(header_cells) for keyword in ["name", "player", "entrant", "entry", "participant"]):
+            if any(keyword in header_text for keyword in _ENTRY_HEADER_KEYWORDS):
                 # This is likely the entry list table
                 for tr in rows[1:]:  # Skip header row
                     cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
                     if len(cells) >= 2:
                         name = cells[1] if len(cells) > 1 else cells[0]  # Try second cell first, then first
+                        name_lower = name.lower()
                         # More strict filtering to avoid navigation items
                         if (name and len(name) > 1 and 
-                            name.lower() not in ["name", "player", "entrant", "entry", "#", "no", "yes"] and
-                            not re.search(r"^\d+$", name) and  # Not just a number
+                            name_lower not in _NON_NAME_CELLS and
+                            not _DIGITS_RE.search(name) and  # Not just a number
                             len(name.split()) <= 4 and  # Reasonable name length
-                            not any(nav_word in name.lower() for nav_word in ["home", "about", "contact", "login", "register", "search", "menu", "navigation"])):
+                            not any(nav_word in name_lower for nav_word in _NAV_WORDS)):
                             
                             # Extract additional info if available
                             participant_info = {
@@ -506,19 +666,12 @@ class EntryListParser:
     
     def _normalize_and_deduplicate(self, participants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize participant names and remove duplicates."""
-        def normalize_name(name: str) -> str:
-            return re.sub(r"\s+", " ", (name or "").strip())
-        
-        # Normalize names
-        for p in participants:
-            p["name"] = normalize_name(p["name"])
-        
-        # Remove duplicates
-        seen = set()
-        unique_participants = []
+        # Keyed by normalized name; the first row seen for a name wins
+        unique_participants = {}
         for p in participants:
-            if p["name"] not in seen:
-                seen.add(p["name"])
-                unique_participants.append(p)
+            name = _WS_RE.sub(" ", (p["name"] or "").strip())
+            if name not in unique_participants:
+                p["name"] = name
+                unique_participants[name] = p
         
-        return unique_participants
+        return list(unique_participants.values())
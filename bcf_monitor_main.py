@@ -8,7 +8,6 @@ This script provides a clean command-line interface to the modular monitoring sy
 
 import argparse
 import sys
-from bcf_monitor import BCFMonitor
 from bcf_monitor.config import Config
 
 
@@ -206,6 +205,10 @@ def main():
     # Validate configuration
     validate_configuration(config)
     
+    # Imported here so --help, --create-config and validation errors don't load
+    # the HTTP, parsing and email stack
+    from bcf_monitor import BCFMonitor
+    
     # Create and run monitor
     try:
         monitor = BCFMonitor(config)